@@ -0,0 +1,54 @@
+import os
+import pickle
+import time
+import zlib
+from contextlib import contextmanager
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.files import locks
+
+
+class LockingFileBasedCache(FileBasedCache):
+    """Файловый кеш с атомарными add и incr.
+
+    FileBasedCache наследует от BaseCache incr из отдельных get и set,
+    и два процесса могут получить одно и то же новое значение, а срок
+    хранения ключа после incr сбрасывается на стандартный. Здесь обе
+    операции выполняются под общей блокировкой файла в каталоге кеша,
+    и incr сохраняет срок хранения ключа.
+    """
+
+    lock_filename = 'cache.lock'
+
+    @contextmanager
+    def _lock(self):
+        self._createdir()
+        with open(os.path.join(self._dir, self.lock_filename), 'ab') as f:
+            locks.lock(f, locks.LOCK_EX)
+            try:
+                yield
+            finally:
+                locks.unlock(f)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        with self._lock():
+            return super().add(key, value, timeout, version)
+
+    def incr(self, key, delta=1, version=None):
+        with self._lock():
+            try:
+                with open(self._key_to_file(key, version), 'rb') as f:
+                    expiry = pickle.load(f)
+                    value = pickle.loads(zlib.decompress(f.read()))
+            except FileNotFoundError:
+                value = None
+            else:
+                if expiry is not None and expiry < time.time():
+                    value = None
+            if value is None:
+                raise ValueError(f"Key '{key}' not found")
+            value += delta
+            timeout = None if expiry is None else expiry - time.time()
+            self.set(key, value, timeout, version)
+            return value
@@ -0,0 +1,82 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+API_PREFIX = '/api/'
+
+# Кодировки в порядке предпочтения сервера; недоступные пропускаются.
+COMPRESSORS = {}
+if brotli is not None:
+    COMPRESSORS['br'] = brotli.compress
+if zstandard is not None:
+    COMPRESSORS['zstd'] = zstandard.ZstdCompressor().compress
+COMPRESSORS['gzip'] = compress_string
+
+
+def negotiate_encoding(request):
+    """Лучшая доступная кодировка из Accept-Encoding или None."""
+    accepted = {}
+    for item in request.META.get('HTTP_ACCEPT_ENCODING', '').split(','):
+        coding, _, params = item.strip().partition(';')
+        quality = 1.0
+        name, _, value = params.strip().partition('=')
+        if name.strip() == 'q':
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    for encoding in COMPRESSORS:
+        if accepted.get(encoding, accepted.get('*', 0.0)) > 0:
+            return encoding
+    return None
+
+
+class CompressionMiddleware:
+    """Сжатие ответов API лучшей кодировкой, которую принимает клиент.
+
+    Ответы короче COMPRESSION_MIN_SIZE не сжимаются. Если у ответа
+    есть `compressed_cache_key`, сжатое тело кладётся в кеш ответов,
+    и следующие такие же запросы получают его без повторного сжатия.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (not request.path.startswith(API_PREFIX)
+                or response.streaming
+                or response.has_header('Content-Encoding')):
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+        encoding = negotiate_encoding(request)
+        if encoding is None:
+            return response
+        content = COMPRESSORS[encoding](response.content)
+        if len(content) >= len(response.content):
+            return response
+        response.content = content
+        response['Content-Length'] = str(len(content))
+        response['Content-Encoding'] = encoding
+        key = getattr(response, 'compressed_cache_key', None)
+        if key is not None:
+            caches[settings.RESPONSE_CACHE_ALIAS].set(
+                key,
+                (response['Content-Type'], content),
+                settings.RESPONSE_CACHE_TIMEOUT
+            )
+        return response
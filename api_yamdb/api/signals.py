@@ -0,0 +1,91 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from api.v1.cache import bump_generation
+from api.v1.indexes import autocomplete_index, genre_index
+from reviews.models import Category, Comment, Genre, Review, Title
+from reviews.utils import titles_bulk_created
+from users.models import CustomUser
+
+VERSIONED_MODELS = (Category, Comment, CustomUser, Genre, Review, Title)
+
+INDEXES = (autocomplete_index, genre_index)
+
+
+# Поколения сдвигаются и индексы обновляются только после фиксации
+# транзакции: иначе параллельный запрос успеет прочитать старые данные,
+# закешировать их под новым поколением, и эта запись уже не сбросится.
+
+
+def mark_applied(model, generation):
+    for index in INDEXES:
+        index.applied(model, generation)
+
+
+@receiver(post_save)
+def invalidate_saved(sender, instance, **kwargs):
+    """Сдвигает поколение сохранённой модели и обновляет индексы."""
+    if sender not in VERSIONED_MODELS:
+        return
+
+    def apply():
+        generation = bump_generation(sender)
+        if sender in autocomplete_index.models:
+            autocomplete_index.update(instance)
+        if sender is Genre:
+            genre_index.update_genre(instance)
+        mark_applied(sender, generation)
+
+    transaction.on_commit(apply)
+
+
+@receiver(post_delete)
+def invalidate_deleted(sender, instance, **kwargs):
+    """Сдвигает поколение модели, из которой удалён объект."""
+    if sender not in VERSIONED_MODELS:
+        return
+    # После удаления Django обнуляет pk объекта, поэтому он
+    # запоминается до фиксации транзакции.
+    pk = instance.pk
+
+    def apply():
+        generation = bump_generation(sender)
+        if sender in autocomplete_index.models:
+            autocomplete_index.remove(sender, pk)
+        if sender is Genre:
+            genre_index.remove_genre(pk)
+        elif sender is Title:
+            genre_index.remove_title(pk)
+        mark_applied(sender, generation)
+
+    transaction.on_commit(apply)
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def invalidate_title_genres(sender, instance, action, reverse, pk_set,
+                            **kwargs):
+    """Сбрасывает кеш произведений при смене их жанров."""
+    if not action.startswith('post_'):
+        return
+    title_ids, genre_ids = ((set(pk_set or ()), [instance.pk]) if reverse
+                            else ([instance.pk], set(pk_set or ())))
+
+    def apply():
+        generation = bump_generation(Title)
+        genre_index.change_membership(
+            title_ids, genre_ids, add=action == 'post_add'
+        )
+        mark_applied(Title, generation)
+
+    transaction.on_commit(apply)
+
+
+@receiver(titles_bulk_created)
+def invalidate_bulk_created(sender, titles, **kwargs):
+    """Сбрасывает кеш произведений после массовой вставки.
+
+    Индексы не дополняются по одному произведению: новое поколение
+    заставит их перезагрузиться при следующем обращении.
+    """
+    transaction.on_commit(lambda: bump_generation(Title))
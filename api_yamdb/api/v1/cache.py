@@ -0,0 +1,206 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.http import (http_date, parse_etags, parse_http_date_safe,
+                               quote_etag)
+from rest_framework import status
+from rest_framework.renderers import (BrowsableAPIRenderer,
+                                      TemplateHTMLRenderer)
+from rest_framework.response import Response
+
+from api.middleware import negotiate_encoding
+
+GENERATION_KEY = 'generation:{}'
+MODIFIED_KEY = 'modified:{}'
+RESPONSE_KEY = 'response:{}'
+COMPRESSED_KEY = 'compressed:{}:{}'
+
+# Вывод этих рендереров зависит от пользователя и CSRF-токена,
+# поэтому отрисованное тело нельзя отдавать другим клиентам.
+PERSONAL_RENDERERS = (BrowsableAPIRenderer, TemplateHTMLRenderer)
+
+
+def get_cache():
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def bump_generation(model):
+    """Инвалидирует все ответы, зависящие от модели.
+
+    Возвращает новое поколение модели. Поколение растёт атомарным
+    incr, поэтому тот, кто знал предыдущее значение, может быть
+    уверен, что между ними других изменений не было.
+    """
+    cache = get_cache()
+    label = model._meta.label_lower
+    cache.set(MODIFIED_KEY.format(label), time.time(), None)
+    key = GENERATION_KEY.format(label)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), None)
+        return cache.incr(key)
+
+
+def get_versions(models):
+    """Поколения моделей и время последнего изменения любой из них.
+
+    Пропавший из кеша счётчик заводится заново по текущему времени,
+    поэтому его значение не совпадёт ни с одним из прежних.
+    """
+    cache = get_cache()
+    labels = [model._meta.label_lower for model in models]
+    keys = [GENERATION_KEY.format(label) for label in labels]
+    modified_keys = [MODIFIED_KEY.format(label) for label in labels]
+    values = cache.get_many(keys + modified_keys)
+    for key in keys:
+        if key not in values:
+            cache.add(key, time.time_ns(), None)
+            values[key] = cache.get(key)
+    now = time.time()
+    for key in modified_keys:
+        if key not in values:
+            cache.add(key, now, None)
+            values[key] = now
+    generations = tuple(values[key] for key in keys)
+    return generations, max(values[key] for key in modified_keys)
+
+
+def get_generations(models):
+    """Текущие номера поколений моделей."""
+    return get_versions(models)[0]
+
+
+class VersionedResponseMixin:
+    """Условные ответы на чтение по поколениям моделей.
+
+    ETag строится из адреса запроса и поколений моделей из
+    `version_models`, поэтому проверка If-None-Match и
+    If-Modified-Since обходится без запросов к базе данных.
+    При `cache_responses` сериализованные ответы ещё и кешируются,
+    а сжатые CompressionMiddleware тела отдаются из кеша как есть,
+    если их вид не зависит от пользователя.
+    """
+
+    version_models = ()
+    cache_responses = False
+
+    def get_version_models(self):
+        """Модели, от которых зависит ответ на текущий запрос."""
+        return self.version_models
+
+    def get_etag(self, request, generations):
+        return hashlib.md5(' '.join((
+            self.basename,
+            self.action,
+            request.build_absolute_uri(),
+            request.META.get('HTTP_ACCEPT', ''),
+            negotiate_encoding(request) or '',
+            *map(str, generations),
+        )).encode('utf-8')).hexdigest()
+
+    def is_not_modified(self, request, etag, last_modified):
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match:
+            return quote_etag(etag) in parse_etags(if_none_match)
+        if_modified_since = parse_http_date_safe(
+            request.META.get('HTTP_IF_MODIFIED_SINCE')
+        )
+        return (if_modified_since is not None
+                and last_modified <= if_modified_since)
+
+    def get_versioned_response(self, handler, request, *args, **kwargs):
+        generations, last_modified = get_versions(
+            self.get_version_models()
+        )
+        etag = self.get_etag(request, generations)
+        last_modified = int(last_modified)
+        headers = {
+            'ETag': quote_etag(etag),
+            'Last-Modified': http_date(last_modified),
+        }
+        if self.is_not_modified(request, etag, last_modified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED,
+                            headers=headers)
+        if self.cache_responses:
+            response = self.get_compressed_response(etag, request)
+            if response is None:
+                response = self.get_cached_response(
+                    RESPONSE_KEY.format(etag), handler,
+                    request, *args, **kwargs
+                )
+                self.set_compressed_cache_key(response, etag, request)
+        else:
+            response = handler(request, *args, **kwargs)
+        if response.status_code != status.HTTP_200_OK:
+            return response
+        # If-None-Match: * совпадает с любым представлением, но только
+        # существующего ресурса: это видно лишь по ответу обработчика.
+        if '*' in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            return Response(status=status.HTTP_304_NOT_MODIFIED,
+                            headers=headers)
+        for header, value in headers.items():
+            response[header] = value
+        return response
+
+    def shares_rendered_body(self, request):
+        """Можно ли отдавать отрисованное тело ответа любому клиенту."""
+        return not isinstance(
+            getattr(request, 'accepted_renderer', None), PERSONAL_RENDERERS
+        )
+
+    def get_compressed_response(self, etag, request):
+        """Уже сжатое тело ответа из кеша или None."""
+        encoding = negotiate_encoding(request)
+        if encoding is None or not self.shares_rendered_body(request):
+            return None
+        cached = get_cache().get(COMPRESSED_KEY.format(etag, encoding))
+        if cached is None:
+            return None
+        content_type, content = cached
+        response = HttpResponse(content, content_type=content_type)
+        response['Content-Encoding'] = encoding
+        patch_vary_headers(response, ('Accept-Encoding',))
+        return response
+
+    def set_compressed_cache_key(self, response, etag, request):
+        """Просит CompressionMiddleware сохранить сжатое тело ответа."""
+        encoding = negotiate_encoding(request)
+        if (encoding is not None
+                and response.status_code == status.HTTP_200_OK
+                and self.shares_rendered_body(request)):
+            response.compressed_cache_key = COMPRESSED_KEY.format(
+                etag, encoding
+            )
+
+    def get_cached_response(self, key, handler, request, *args, **kwargs):
+        cache = get_cache()
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, settings.RESPONSE_CACHE_TIMEOUT)
+        return response
+
+
+class VersionedListMixin(VersionedResponseMixin):
+    """Условные и кешируемые ответы на получение списка."""
+
+    def list(self, request, *args, **kwargs):
+        return self.get_versioned_response(
+            super().list, request, *args, **kwargs
+        )
+
+
+class VersionedRetrieveMixin(VersionedResponseMixin):
+    """Условные и кешируемые ответы на получение объекта."""
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_versioned_response(
+            super().retrieve, request, *args, **kwargs
+        )
@@ -0,0 +1,112 @@
+from abc import ABC, abstractmethod
+from collections import defaultdict
+
+from django.db.models import F
+from rest_framework import serializers
+
+from reviews.models import Title
+
+DATETIME_FIELD = serializers.DateTimeField()
+
+
+class FastListSerializer(ABC):
+    """Сериализация списка из строк values_list() без экземпляров моделей.
+
+    Строки — именованные кортежи со слотами: у них есть атрибуты, нужные
+    пагинации по курсору, но нет ни модели, ни полей DRF на каждую строку.
+    Результат совпадает с выводом соответствующего ModelSerializer.
+    """
+
+    annotations = {}
+    columns = ()
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    @classmethod
+    def get_rows(cls, queryset):
+        """Ленивый queryset строк для пагинации."""
+        return queryset.select_related(None).prefetch_related(
+            None
+        ).annotate(**cls.annotations).values_list(*cls.columns, named=True)
+
+    @abstractmethod
+    def to_representation(self, row):
+        """Словарь ответа для одной строки."""
+
+    @property
+    def data(self):
+        return [self.to_representation(row) for row in self.rows]
+
+    @classmethod
+    def iterate(cls, queryset, chunk_size):
+        """Все объекты queryset пачками по chunk_size в порядке id.
+
+        Каждая пачка выбирается условием по id, а не OFFSET, и
+        сериализуется целиком, поэтому память не растёт с размером
+        выборки.
+        """
+        rows = cls.get_rows(queryset).order_by('pk')
+        last_pk = None
+        while True:
+            chunk = rows if last_pk is None else rows.filter(pk__gt=last_pk)
+            chunk = list(chunk[:chunk_size])
+            if not chunk:
+                return
+            yield from cls(chunk).data
+            last_pk = chunk[-1].id
+
+
+class FastTitleSerializer(FastListSerializer):
+    """Список произведений в формате TitleSerializer."""
+
+    annotations = {
+        'category_name': F('category__name'),
+        'category_slug': F('category__slug'),
+    }
+    columns = (
+        'id', 'name', 'year', 'description', 'rating',
+        'category_name', 'category_slug',
+    )
+
+    def __init__(self, rows):
+        super().__init__(rows)
+        self.genres = defaultdict(list)
+        if not self.rows:
+            return
+        for title_id, name, slug in Title.genre.through.objects.filter(
+            title_id__in=[row.id for row in self.rows]
+        ).order_by('genre__name').values_list(
+            'title_id', 'genre__name', 'genre__slug'
+        ):
+            self.genres[title_id].append({'name': name, 'slug': slug})
+
+    def to_representation(self, row):
+        return {
+            'id': row.id,
+            'name': row.name,
+            'year': row.year,
+            'description': row.description,
+            'genre': self.genres[row.id],
+            'category': None if row.category_slug is None else {
+                'name': row.category_name,
+                'slug': row.category_slug,
+            },
+            'rating': None if row.rating is None else int(row.rating),
+        }
+
+
+class FastReviewSerializer(FastListSerializer):
+    """Список отзывов в формате ReviewSerializer."""
+
+    annotations = {'author_username': F('author__username')}
+    columns = ('id', 'text', 'author_username', 'score', 'pub_date')
+
+    def to_representation(self, row):
+        return {
+            'id': row.id,
+            'text': row.text,
+            'author': row.author_username,
+            'score': row.score,
+            'pub_date': DATETIME_FIELD.to_representation(row.pub_date),
+        }
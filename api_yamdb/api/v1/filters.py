@@ -1,16 +1,106 @@
+import json
+
 import django_filters
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import OrderingFilter
+
+from api.v1.indexes import genre_index
 from reviews.models import Title
+from reviews.search import search_titles
+
+DECADE = 10
+
+GENRE_MODE_ALL = 'all'
+
+GENRE_MODE_ANY = 'any'
+
+GENRE_MODES = (
+    (GENRE_MODE_ALL, 'Все жанры'),
+    (GENRE_MODE_ANY, 'Любой из жанров'),
+)
+
+
+def filter_by_ids(queryset, ids):
+    """Ограничивает выборку списком id.
+
+    В SQLite список передаётся одним JSON-параметром, поэтому его
+    длина не упирается в лимит переменных запроса.
+    """
+    if connection.vendor != 'sqlite':
+        return queryset.filter(pk__in=ids)
+    return queryset.filter(pk__in=RawSQL(
+        'SELECT value FROM json_each(%s)', (json.dumps(sorted(ids)),)
+    ))
 
 
 class TitleFilter(django_filters.FilterSet):
     """Фильтрует список всех произведений."""
-    category = django_filters.CharFilter(field_name='category__slug',
-                                         lookup_expr='iexact')
-    genre = django_filters.CharFilter(field_name='genre__slug',
-                                      lookup_expr='iexact')
+    category = django_filters.CharFilter(method='filter_category')
+    genre = django_filters.CharFilter(method='filter_genre')
+    genre_mode = django_filters.ChoiceFilter(
+        choices=GENRE_MODES, method='filter_genre_mode'
+    )
     name = django_filters.CharFilter(field_name='name',
                                      lookup_expr='icontains')
+    q = django_filters.CharFilter(method='filter_search')
+    year_min = django_filters.NumberFilter(field_name='year',
+                                           lookup_expr='gte')
+    year_max = django_filters.NumberFilter(field_name='year',
+                                           lookup_expr='lte')
+    decade = django_filters.NumberFilter(method='filter_decade')
 
     class Meta:
         model = Title
-        fields = ('category', 'genre', 'name', 'year')
+        fields = ('category', 'genre', 'genre_mode', 'name', 'year', 'q',
+                  'year_min', 'year_max', 'decade')
+
+    @staticmethod
+    def split(value):
+        return [slug for slug in value.split(',') if slug]
+
+    def filter_category(self, queryset, name, value):
+        """Произведения из любой из перечисленных через запятую категорий."""
+        condition = Q()
+        for slug in self.split(value):
+            condition |= Q(category__slug__iexact=slug)
+        return queryset.filter(condition)
+
+    def filter_genre(self, queryset, name, value):
+        """Произведения с любым или со всеми перечисленными жанрами.
+
+        Список id берётся из индекса жанров в памяти и передаётся
+        в базу одним параметром.
+        """
+        match_all = self.form.cleaned_data.get('genre_mode') == GENRE_MODE_ALL
+        title_ids = genre_index.filter(self.split(value), match_all)
+        return filter_by_ids(queryset, title_ids)
+
+    def filter_genre_mode(self, queryset, name, value):
+        """Режим учитывается в filter_genre."""
+        return queryset
+
+    def filter_decade(self, queryset, name, value):
+        """Произведения десятилетия: decade=1980 — годы 1980–1989."""
+        start = int(value) // DECADE * DECADE
+        return queryset.filter(year__gte=start, year__lt=start + DECADE)
+
+    def filter_search(self, queryset, name, value):
+        """Полнотекстовый поиск по названию и описанию."""
+        return search_titles(queryset, value)
+
+
+class TitleOrderingFilter(OrderingFilter):
+    """Сортировка произведений с id для однозначного порядка.
+
+    id идёт в ту же сторону, что и первое поле, чтобы сортировка
+    целиком читалась из индекса (поле, id).
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering or 'id' in ordering or '-id' in ordering:
+            return ordering
+        tie_breaker = '-id' if ordering[0].startswith('-') else 'id'
+        return (*ordering, tie_breaker)
@@ -0,0 +1,238 @@
+import re
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+
+from api.v1.cache import get_generations
+from reviews.models import Category, Genre, Title
+
+WORD_START = re.compile(r'\b\w', re.UNICODE)
+
+
+class InMemoryIndex(ABC):
+    """Индекс в памяти процесса, сверяемый с поколениями моделей.
+
+    Изменения этого процесса применяются из сигналов, а изменения
+    других процессов замечаются по поколениям моделей из `models`
+    и приводят к перезагрузке.
+    """
+
+    models = ()
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._generations = None
+
+    @abstractmethod
+    def load(self):
+        """Заполняет индекс из базы данных."""
+
+    def ensure_loaded(self):
+        """Перезагружает индекс, если каталог менялся в других процессах."""
+        generations = dict(zip(self.models, get_generations(self.models)))
+        if generations == self._generations:
+            return
+        with self._lock:
+            self.load()
+            self._generations = generations
+
+    def is_loaded(self):
+        return self._generations is not None
+
+    def applied(self, model, generation):
+        """Отмечает, что изменение модели уже учтено в индексе.
+
+        Поколение сдвигается, только если индекс знал предыдущее:
+        иначе между загрузкой и этим изменением были чужие, и индекс
+        перезагрузится при следующем обращении.
+        """
+        with self._lock:
+            if (self.is_loaded()
+                    and self._generations.get(model) == generation - 1):
+                self._generations[model] = generation
+
+
+class AutocompleteIndex(InMemoryIndex):
+    """Отсортированный индекс названий для подсказок по префиксу.
+
+    Каждое название попадает в индекс начиная с каждого своего слова,
+    поэтому «орешек» находит «Крепкий орешек».
+    """
+
+    kinds = {
+        Title: 'title',
+        Genre: 'genre',
+        Category: 'category',
+    }
+    models = tuple(kinds)
+
+    def __init__(self):
+        super().__init__()
+        self._entries = []
+        self._keys_by_object = {}
+
+    @staticmethod
+    def normalize(text):
+        return ' '.join(text.casefold().split())
+
+    @staticmethod
+    def get_fields(kind):
+        return ('id', 'name') if kind == 'title' else ('name', 'slug')
+
+    def load(self):
+        self._entries = []
+        self._keys_by_object = {}
+        for model, kind in self.kinds.items():
+            for obj in model.objects.order_by().only(*self.get_fields(kind)):
+                self._add(kind, obj)
+        self._entries.sort()
+
+    def _add(self, kind, obj, keep_sorted=False):
+        name = self.normalize(obj.name)
+        identifier = obj.id if kind == 'title' else obj.slug
+        keys = []
+        for match in WORD_START.finditer(name):
+            entry = (name[match.start():], kind, identifier, obj.name)
+            keys.append(entry)
+            if keep_sorted:
+                insort(self._entries, entry)
+            else:
+                self._entries.append(entry)
+        self._keys_by_object[(kind, obj.pk)] = keys
+
+    def _remove(self, kind, pk):
+        for entry in self._keys_by_object.pop((kind, pk), ()):
+            position = bisect_left(self._entries, entry)
+            if (position < len(self._entries)
+                    and self._entries[position] == entry):
+                del self._entries[position]
+
+    def update(self, obj):
+        """Применяет сохранение объекта каталога."""
+        kind = self.kinds[type(obj)]
+        with self._lock:
+            if self.is_loaded():
+                self._remove(kind, obj.pk)
+                self._add(kind, obj, keep_sorted=True)
+
+    def remove(self, model, pk):
+        """Применяет удаление объекта каталога."""
+        with self._lock:
+            if self.is_loaded():
+                self._remove(self.kinds[model], pk)
+
+    def search(self, prefix, limit):
+        """Первые limit названий, в которых есть слово с таким началом."""
+        prefix = self.normalize(prefix)
+        if not prefix:
+            return []
+        self.ensure_loaded()
+        results = []
+        seen = set()
+        with self._lock:
+            position = bisect_left(self._entries, (prefix,))
+            while position < len(self._entries) and len(results) < limit:
+                key, kind, identifier, name = self._entries[position]
+                if not key.startswith(prefix):
+                    break
+                position += 1
+                if (kind, identifier) in seen:
+                    continue
+                seen.add((kind, identifier))
+                results.append((kind, identifier, name))
+        return results
+
+
+class GenreIndex(InMemoryIndex):
+    """Множества id произведений каждого жанра.
+
+    Фильтр по нескольким жанрам сводится к пересечению или
+    объединению множеств в памяти вместо соединений таблиц.
+    """
+
+    models = (Genre, Title)
+
+    def __init__(self):
+        super().__init__()
+        self._titles = {}
+        self._slugs = {}
+
+    def load(self):
+        self._slugs = {
+            slug.lower(): pk
+            for pk, slug in Genre.objects.values_list('pk', 'slug')
+        }
+        self._titles = {pk: set() for pk in self._slugs.values()}
+        # Жанр мог появиться между двумя запросами; его slug подтянет
+        # следующая перезагрузка по поколению.
+        for title_id, genre_id in Title.genre.through.objects.values_list(
+            'title_id', 'genre_id'
+        ):
+            self._titles.setdefault(genre_id, set()).add(title_id)
+
+    def update_genre(self, genre):
+        """Применяет сохранение жанра."""
+        with self._lock:
+            if not self.is_loaded():
+                return
+            for slug, pk in list(self._slugs.items()):
+                if pk == genre.pk:
+                    del self._slugs[slug]
+            self._slugs[genre.slug.lower()] = genre.pk
+            self._titles.setdefault(genre.pk, set())
+
+    def remove_genre(self, pk):
+        """Применяет удаление жанра."""
+        with self._lock:
+            if not self.is_loaded():
+                return
+            for slug, genre_pk in list(self._slugs.items()):
+                if genre_pk == pk:
+                    del self._slugs[slug]
+            self._titles.pop(pk, None)
+
+    def remove_title(self, pk):
+        """Применяет удаление произведения."""
+        with self._lock:
+            if not self.is_loaded():
+                return
+            for title_ids in self._titles.values():
+                title_ids.discard(pk)
+
+    def change_membership(self, title_ids, genre_ids, add):
+        """Применяет добавление или удаление связей произведений и жанров.
+
+        Пустой genre_ids означает все жанры, пустой title_ids —
+        все произведения.
+        """
+        with self._lock:
+            if not self.is_loaded():
+                return
+            for genre_id in genre_ids or list(self._titles):
+                members = self._titles.setdefault(genre_id, set())
+                if add:
+                    members.update(title_ids)
+                elif title_ids:
+                    members.difference_update(title_ids)
+                else:
+                    members.clear()
+
+    def filter(self, slugs, match_all):
+        """id произведений с любым (или со всеми) из жанров."""
+        self.ensure_loaded()
+        with self._lock:
+            sets = [
+                self._titles.get(self._slugs.get(slug.lower()), set())
+                for slug in slugs
+            ]
+            if not sets:
+                return set()
+            if match_all:
+                sets.sort(key=len)
+                return set(sets[0]).intersection(*sets[1:])
+            return set().union(*sets)
+
+
+autocomplete_index = AutocompleteIndex()
+
+genre_index = GenreIndex()
@@ -0,0 +1,136 @@
+import base64
+import binascii
+import json
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class TitleCursorPagination(BasePagination):
+    """Постраничный вывод произведений по курсору.
+
+    Страница выбирается условием по (-year, name, id) вместо OFFSET
+    и не требует COUNT(*), поэтому время ответа не зависит
+    от глубины страницы.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = 'cursor'
+    mode_query_param = 'pagination'
+    mode = 'cursor'
+    invalid_cursor_message = 'Неверный курсор.'
+
+    @classmethod
+    def is_requested(cls, request):
+        """Клиент запросил пагинацию по курсору."""
+        return (cls.cursor_query_param in request.query_params
+                or request.query_params.get(cls.mode_query_param) == cls.mode)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor['reverse'])
+        if reverse:
+            queryset = queryset.order_by('year', '-name', '-id')
+        else:
+            queryset = queryset.order_by('-year', 'name', 'id')
+        if cursor:
+            queryset = queryset.filter(self.position_filter(cursor))
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, bool(cursor)
+        self.page = results
+        return results
+
+    def position_filter(self, cursor):
+        """Условие «после курсора» в порядке выдачи страницы.
+
+        Внешняя граница по году позволяет базе читать индекс
+        title_year_name_id_idx по порядку с позиции курсора; без неё
+        OR из трёх условий сортирует все строки после курсора.
+        """
+        year, name, pk = cursor['year'], cursor['name'], cursor['id']
+        if cursor['reverse']:
+            return Q(year__gte=year) & (
+                Q(year__gt=year)
+                | Q(year=year, name__lt=name)
+                | Q(year=year, name=name, id__lt=pk)
+            )
+        return Q(year__lte=year) & (
+            Q(year__lt=year)
+            | Q(year=year, name__gt=name)
+            | Q(year=year, name=name, id__gt=pk)
+        )
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            reverse, year, name, pk = json.loads(
+                base64.urlsafe_b64decode(encoded.encode('ascii'))
+            )
+            return {
+                'reverse': bool(reverse),
+                'year': int(year),
+                'name': str(name),
+                'id': int(pk),
+            }
+        except (TypeError, ValueError, UnicodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, title, reverse):
+        encoded = base64.urlsafe_b64encode(json.dumps(
+            [reverse, title.year, title.name, title.id]
+        ).encode('utf-8')).decode('ascii')
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, encoded
+        )
+
+    def get_first_link(self):
+        return replace_query_param(
+            remove_query_param(self.base_url, self.cursor_query_param),
+            self.mode_query_param,
+            self.mode
+        )
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if not self.page:
+            return self.get_first_link()
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return self.get_first_link()
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True},
+                'previous': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
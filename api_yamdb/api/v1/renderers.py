@@ -0,0 +1,77 @@
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = 'application/msgpack'
+
+
+def encode_default(obj):
+    """Приводит к простым типам то, что понимает JSONEncoder из DRF."""
+    return JSONEncoder().default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON через orjson с тем же выводом, что у JSONRenderer.
+
+    Без orjson и при запросе отступов работает как JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (orjson is None or data is None
+                or self.get_indent(accepted_media_type,
+                                   renderer_context or {})):
+            return super().render(
+                data, accepted_media_type, renderer_context
+            )
+        ret = orjson.dumps(data, default=encode_default)
+        # Как и JSONRenderer, экранирует разделители строк для JavaScript.
+        return ret.replace(
+            '\u2028'.encode(), b'\\u2028'
+        ).replace('\u2029'.encode(), b'\\u2029')
+
+
+class NDJSONRenderer(ORJSONRenderer):
+    """Одна строка JSON с переводом строки: элемент потока NDJSON."""
+
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return super().render(data) + b'\n'
+
+
+class MessagePackRenderer(BaseRenderer):
+    """Ответы в формате MessagePack."""
+
+    media_type = MSGPACK_MEDIA_TYPE
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=encode_default, use_bin_type=True)
+
+
+class MessagePackParser(BaseParser):
+    """Тело запроса в формате MessagePack."""
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, TypeError) as error:
+            raise ParseError(f'Ошибка разбора MessagePack: {error}')
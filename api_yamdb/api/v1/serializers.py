@@ -1,14 +1,37 @@
-from django.shortcuts import get_object_or_404
 from rest_framework import serializers
 from rest_framework.validators import (UniqueTogetherValidator,
                                        UniqueValidator)
 
-from api_yamdb.constants import MAX_NAME_LENGTH
-from reviews.models import Category, Comment, Genre, Review, Title
+from api_yamdb.constants import (HISTOGRAM_PERCENTILES, MAX_NAME_LENGTH,
+                                 SLUG_MAX_LENGTH)
+from reviews.models import (Category, Comment, Genre, Review, ScoreHistogram,
+                            Title)
+from reviews.utils import bulk_create_titles
 from users.models import CustomUser
+from .utils import get_requested_fields
 from .validators import validate_username
 
 
+class SparseFieldsSerializerMixin:
+    """Отдаёт только поля, перечисленные в ?fields=.
+
+    Отбор действует лишь на корневой сериалайзер ответа, вложенные
+    сериалайзеры незапрошенных полей не строятся вовсе.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.root is not self and self.root is not self.parent:
+            return fields
+        requested = get_requested_fields(self.context.get('request'))
+        if requested is None:
+            return fields
+        return {
+            name: field for name, field in fields.items()
+            if name in requested
+        }
+
+
 class CategorySerializer(serializers.ModelSerializer):
     """Сериалайзер для категории."""
 
@@ -25,7 +48,8 @@ class GenreSerializer(serializers.ModelSerializer):
         fields = ('name', 'slug')
 
 
-class TitleSerializer(serializers.ModelSerializer):
+class TitleSerializer(SparseFieldsSerializerMixin,
+                      serializers.ModelSerializer):
     """Сериалайзер для заголовка c полями только для чтения."""
 
     category = CategorySerializer(read_only=True)
@@ -40,6 +64,67 @@ class TitleSerializer(serializers.ModelSerializer):
         )
 
 
+class TopTitleSerializer(TitleSerializer):
+    """Сериалайзер для произведения в рейтинге лучших."""
+
+    bayesian_rating = serializers.FloatField(read_only=True)
+
+    class Meta(TitleSerializer.Meta):
+        fields = TitleSerializer.Meta.fields + ('bayesian_rating',)
+
+
+class SimilarTitleSerializer(TitleSerializer):
+    """Сериалайзер для похожего произведения."""
+
+    similarity = serializers.FloatField(read_only=True)
+
+    class Meta(TitleSerializer.Meta):
+        fields = TitleSerializer.Meta.fields + ('similarity',)
+
+
+class RecommendedTitleSerializer(TitleSerializer):
+    """Сериалайзер для рекомендованного произведения."""
+
+    predicted_score = serializers.FloatField(read_only=True)
+
+    class Meta(TitleSerializer.Meta):
+        fields = TitleSerializer.Meta.fields + ('predicted_score',)
+
+
+class TrendingTitleSerializer(TitleSerializer):
+    """Сериалайзер для произведения в списке популярных сейчас."""
+
+    activity = serializers.FloatField(read_only=True)
+
+    class Meta(TitleSerializer.Meta):
+        fields = TitleSerializer.Meta.fields + ('activity',)
+
+
+class ScoreHistogramSerializer(serializers.ModelSerializer):
+    """Сериалайзер для распределения оценок произведения."""
+
+    counts = serializers.SerializerMethodField()
+    count = serializers.SerializerMethodField()
+    median = serializers.FloatField(read_only=True)
+    percentiles = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ScoreHistogram
+        fields = ('counts', 'count', 'median', 'percentiles')
+
+    def get_counts(self, obj):
+        return {str(score): count for score, count in obj.counts.items()}
+
+    def get_count(self, obj):
+        return sum(obj.counts.values())
+
+    def get_percentiles(self, obj):
+        return {
+            str(percent): obj.percentile(percent)
+            for percent in HISTOGRAM_PERCENTILES
+        }
+
+
 class TitleChangeSerializer(serializers.ModelSerializer):
     """Сериалайзер для изменения заголовка."""
 
@@ -61,6 +146,85 @@ class TitleChangeSerializer(serializers.ModelSerializer):
         )
 
 
+class TitleBulkListSerializer(serializers.ListSerializer):
+    """Массовое создание произведений.
+
+    Слаги категорий и жанров всех произведений проверяются двумя
+    запросами, а не отдельным запросом на каждое поле.
+    """
+
+    def to_internal_value(self, data):
+        attrs = super().to_internal_value(data)
+        categories = Category.objects.in_bulk(
+            {item['category']['slug'] for item in attrs}, field_name='slug'
+        )
+        genres = Genre.objects.in_bulk(
+            {slug for item in attrs for slug in item['genre_slugs']},
+            field_name='slug'
+        )
+        does_not_exist = serializers.SlugRelatedField.default_error_messages[
+            'does_not_exist'
+        ]
+        errors = []
+        for item in attrs:
+            error = {}
+            slug = item['category']['slug']
+            if slug not in categories:
+                error['category'] = [
+                    does_not_exist.format(slug_name='slug', value=slug)
+                ]
+            missing = [
+                slug for slug in item['genre_slugs'] if slug not in genres
+            ]
+            if missing:
+                error['genre'] = [
+                    does_not_exist.format(slug_name='slug', value=slug)
+                    for slug in missing
+                ]
+            errors.append(error)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        for item in attrs:
+            item['category'] = categories[item['category']['slug']]
+            item['genre'] = [genres[slug] for slug in item['genre_slugs']]
+        return attrs
+
+    def create(self, validated_data):
+        titles = []
+        for item in validated_data:
+            title = Title(
+                name=item['name'],
+                year=item['year'],
+                description=item.get('description', ''),
+                category=item['category'],
+            )
+            title.genre_slugs = item['genre_slugs']
+            titles.append(title)
+        return bulk_create_titles(
+            titles, [item['genre'] for item in validated_data]
+        )
+
+
+class TitleBulkSerializer(serializers.ModelSerializer):
+    """Сериалайзер для массового создания произведений."""
+
+    category = serializers.SlugField(
+        source='category.slug', max_length=SLUG_MAX_LENGTH
+    )
+    genre = serializers.ListField(
+        source='genre_slugs',
+        child=serializers.SlugField(max_length=SLUG_MAX_LENGTH)
+    )
+
+    class Meta:
+        model = Title
+        fields = (
+            'id', 'name', 'year', 'description', 'genre',
+            'category'
+        )
+        list_serializer_class = TitleBulkListSerializer
+
+
 class TokenSerializer(serializers.ModelSerializer):
     """Сериалайзер для получения токена."""
 
@@ -116,14 +280,14 @@ class CurrentTitleDefault:
     requires_context = True
 
     def __call__(self, serializer_field):
-        title_id = serializer_field.context['view'].kwargs.get('title_id')
-        return get_object_or_404(Title, id=title_id)
+        return serializer_field.context['view'].get_title()
 
     def __repr__(self):
         return '%s()' % self.__class__.__name__
 
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(SparseFieldsSerializerMixin,
+                       serializers.ModelSerializer):
     """Сериалайзер для отзывов."""
 
     author = serializers.SlugRelatedField(
@@ -145,7 +309,8 @@ class ReviewSerializer(serializers.ModelSerializer):
         ]
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(SparseFieldsSerializerMixin,
+                        serializers.ModelSerializer):
     """Сериалайзер для комментов."""
 
     author = serializers.StringRelatedField(
@@ -157,3 +322,29 @@ class CommentSerializer(serializers.ModelSerializer):
         fields = (
             'id', 'text', 'author', 'pub_date'
         )
+
+
+class ReviewPreviewSerializer(ReviewSerializer):
+    """Сериалайзер для отзыва на странице произведения."""
+
+    comments_preview = CommentSerializer(many=True, read_only=True)
+
+    class Meta(ReviewSerializer.Meta):
+        fields = ('id', 'text', 'author', 'score', 'pub_date',
+                  'comments_preview')
+        validators = ()
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if 'comments_preview' not in self.context.get('include', ()):
+            del fields['comments_preview']
+        return fields
+
+
+class TitlePageSerializer(TitleSerializer):
+    """Сериалайзер для произведения вместе с первыми отзывами."""
+
+    reviews_preview = ReviewPreviewSerializer(many=True, read_only=True)
+
+    class Meta(TitleSerializer.Meta):
+        fields = TitleSerializer.Meta.fields + ('reviews_preview',)
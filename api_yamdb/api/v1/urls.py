@@ -1,8 +1,9 @@
 from django.urls import include, path
 from rest_framework.routers import SimpleRouter
 
-from .views import (APISignUp, APIToken, CategoryViewSet, CommentViewSet,
-                    GenreViewSet, ReviewViewSet, TitleViewSet, UsersViewSet)
+from .views import (APIAutocomplete, APISignUp, APIToken, CategoryViewSet,
+                    CommentViewSet, GenreViewSet, ReviewViewSet, TitleViewSet,
+                    UsersViewSet)
 
 router_v1 = SimpleRouter()
 router_v1.register('categories', CategoryViewSet, basename='categories')
@@ -25,5 +26,6 @@ auth_patterns = [
 
 urlpatterns = [
     path('auth/', include(auth_patterns)),
+    path('autocomplete/', APIAutocomplete.as_view(), name='autocomplete'),
     path('', include(router_v1.urls))
 ]
@@ -1,9 +1,24 @@
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.core.mail import send_mail
 from django.db.models.query import prefetch_related_objects
-from rest_framework import mixins, viewsets
+from rest_framework import mixins, permissions, serializers, viewsets
 from rest_framework.response import Response
 
+from api_yamdb.constants import MAX_INTEGER_KEY, MULTI_GET_MAX_SIZE
+
+FIELDS_QUERY_PARAM = 'fields'
+
+
+def get_requested_fields(request):
+    """Поля, перечисленные клиентом в ?fields=, или None."""
+    if request is None or request.method not in permissions.SAFE_METHODS:
+        return None
+    value = request.query_params.get(FIELDS_QUERY_PARAM)
+    if not value:
+        return None
+    return {field.strip() for field in value.split(',') if field.strip()}
+
 
 class CreateDestroyListViewSet(mixins.CreateModelMixin,
                                mixins.DestroyModelMixin,
@@ -14,6 +29,128 @@ class CreateDestroyListViewSet(mixins.CreateModelMixin,
     pass
 
 
+class SparseFieldsMixin:
+    """Читает из базы только поля, запрошенные в ?fields=.
+
+    Лишние столбцы откладываются через only(), а select_related и
+    prefetch_related для незапрошенных связей отбрасываются.
+    Поля из `sparse_required_fields` загружаются всегда, а у
+    оставшихся связей загружаются только ранее выбранные через only()
+    столбцы.
+    """
+
+    sparse_required_fields = ()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        fields = get_requested_fields(self.request)
+        if fields is None or self.action not in ('list', 'retrieve'):
+            return queryset
+        concrete = {
+            field.name for field in queryset.model._meta.concrete_fields
+        }
+        selected = queryset.query.select_related
+        selected = (
+            [name for name in selected if name in fields]
+            if isinstance(selected, dict) else []
+        )
+        prefetched = [
+            lookup for lookup in queryset._prefetch_related_lookups
+            if getattr(lookup, 'prefetch_through', lookup).split('__')[0]
+            in fields
+        ]
+        loaded = (fields | set(self.sparse_required_fields)) & concrete
+        names, defer = queryset.query.deferred_loading
+        related = [] if defer else [
+            name for name in names
+            if '__' in name and name.split('__')[0] in selected
+        ]
+        queryset = queryset.select_related(None).prefetch_related(None)
+        return queryset.select_related(*selected).prefetch_related(
+            *prefetched
+        ).only('pk', *loaded, *selected, *related)
+
+
+class MultiGetMixin:
+    """Получение объектов по списку ключей из `multi_get_param`.
+
+    Все объекты выбираются одним запросом через in_bulk вместе
+    с общими prefetch_related и отдаются в порядке ключей запроса
+    списком без пагинации, отсутствующие ключи пропускаются.
+    """
+
+    multi_get_param = 'ids'
+    multi_get_field = 'pk'
+
+    def get_multi_get_keys(self):
+        value = self.request.query_params.get(self.multi_get_param)
+        if value is None:
+            return None
+        keys = list(dict.fromkeys(
+            key.strip() for key in value.split(',') if key.strip()
+        ))
+        if len(keys) > MULTI_GET_MAX_SIZE:
+            raise serializers.ValidationError({
+                self.multi_get_param:
+                    f'Не больше {MULTI_GET_MAX_SIZE} значений за запрос.'
+            })
+        opts = self.get_queryset().model._meta
+        field = (opts.pk if self.multi_get_field == 'pk'
+                 else opts.get_field(self.multi_get_field))
+        try:
+            keys = [field.to_python(key) for key in keys]
+        except ValidationError as error:
+            raise serializers.ValidationError(
+                {self.multi_get_param: error.messages}
+            )
+        if any(isinstance(key, int) and abs(key) > MAX_INTEGER_KEY
+               for key in keys):
+            raise serializers.ValidationError({
+                self.multi_get_param: 'Значение вне допустимого диапазона.'
+            })
+        return keys
+
+    def list(self, request, *args, **kwargs):
+        keys = self.get_multi_get_keys()
+        if keys is None:
+            return super().list(request, *args, **kwargs)
+        objects = self.filter_queryset(self.get_queryset()).in_bulk(
+            keys, field_name=self.multi_get_field
+        )
+        serializer = self.get_serializer(
+            [objects[key] for key in keys if key in objects], many=True
+        )
+        return Response(serializer.data)
+
+
+class FastListMixin:
+    """Список через `fast_serializer_class` вместо ModelSerializer.
+
+    Включается настройкой FAST_READ_SERIALIZERS. Запросы с ?fields=
+    обслуживает обычный сериалайзер.
+    """
+
+    fast_serializer_class = None
+
+    def use_fast_serializer(self):
+        return (settings.FAST_READ_SERIALIZERS
+                and self.fast_serializer_class is not None
+                and get_requested_fields(self.request) is None)
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_fast_serializer():
+            return super().list(request, *args, **kwargs)
+        rows = self.fast_serializer_class.get_rows(
+            self.filter_queryset(self.get_queryset())
+        )
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(
+                self.fast_serializer_class(page).data
+            )
+        return Response(self.fast_serializer_class(list(rows)).data)
+
+
 class PatchModelMixin:
     """Создание миксина без PUT-запроса."""
 
@@ -48,6 +185,15 @@ class CreateListRetrieveDestroyViewSet(mixins.CreateModelMixin,
     pass
 
 
+def get_limit(request, default, maximum):
+    """Размер выдачи из параметра limit, ограниченный сверху."""
+    try:
+        limit = int(request.query_params.get('limit', default))
+    except ValueError:
+        return default
+    return max(1, min(limit, maximum))
+
+
 def send_code(email, confirmation_code):
     """Отправка email-сообщения."""
     send_mail(
@@ -1,6 +1,12 @@
+import math
+
 from django.contrib.auth.tokens import default_token_generator
-from django.db.models import Avg
+from django.db import transaction
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.functions import Exp
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, permissions, status
 from rest_framework.decorators import action
@@ -10,25 +16,44 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import AccessToken
 
-from api.v1.filters import TitleFilter
+from api.v1.cache import VersionedListMixin, VersionedRetrieveMixin
+from api.v1.fast_serializers import FastReviewSerializer, FastTitleSerializer
+from api.v1.filters import TitleFilter, TitleOrderingFilter
+from api.v1.indexes import autocomplete_index
+from api.v1.pagination import TitleCursorPagination
+from api.v1.renderers import NDJSONRenderer
 from api.v1.permissions import (IsAdminIsModeratorIsAuthor,
                                 IsAdminIsUserOrReadOnly,
                                 IsSuperUserOrIsAdmin)
 from api.v1.serializers import (CategorySerializer, CommentSerializer,
                                 CustomUserSerializer, GenreSerializer,
-                                ReviewSerializer, SignUpSerializer,
-                                TitleChangeSerializer, TitleSerializer,
-                                TokenSerializer)
+                                RecommendedTitleSerializer, ReviewSerializer,
+                                ScoreHistogramSerializer, SignUpSerializer,
+                                SimilarTitleSerializer, TitleBulkSerializer,
+                                TitleChangeSerializer, TitlePageSerializer,
+                                TitleSerializer, TokenSerializer,
+                                TopTitleSerializer, TrendingTitleSerializer)
 from api.v1.utils import (CreateDestroyListViewSet,
-                          CreateListRetrieveDestroyViewSet,
+                          CreateListRetrieveDestroyViewSet, FastListMixin,
+                          MultiGetMixin, SparseFieldsMixin, get_limit,
                           send_code)
-from reviews.models import Category, Genre, Review, Title
+from api_yamdb.constants import (AUTOCOMPLETE_LIMIT, AUTOCOMPLETE_MAX_LIMIT,
+                                 COMMENTS_PREVIEW_SIZE, EXPORT_CHUNK_SIZE,
+                                 LEADERBOARD_MAX_SIZE, LEADERBOARD_SIZE,
+                                 RECOMMENDATIONS_SIZE, REVIEWS_PREVIEW_SIZE,
+                                 SIMILAR_TITLES_SIZE, TRENDING_MAX_SIZE,
+                                 TRENDING_MIN_ACTIVITY, TRENDING_SIZE)
+from reviews.models import (Category, Comment, Genre, Review, ScoreHistogram,
+                            Title)
+from reviews.utils import activity_time
 from users.models import CustomUser
 
 
-class CategoryViewSet(CreateDestroyListViewSet):
+class CategoryViewSet(VersionedListMixin, CreateDestroyListViewSet):
     """Работа с категориями."""
 
+    version_models = (Category,)
+    cache_responses = True
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = (IsAdminIsUserOrReadOnly,)
@@ -38,9 +63,11 @@ class CategoryViewSet(CreateDestroyListViewSet):
     lookup_field = 'slug'
 
 
-class GenreViewSet(CreateDestroyListViewSet):
+class GenreViewSet(VersionedListMixin, CreateDestroyListViewSet):
     """Работа с жанрами."""
 
+    version_models = (Genre,)
+    cache_responses = True
     queryset = Genre.objects.all()
     serializer_class = GenreSerializer
     permission_classes = (IsAdminIsUserOrReadOnly,)
@@ -49,23 +76,255 @@ class GenreViewSet(CreateDestroyListViewSet):
     lookup_field = 'slug'
 
 
-class TitleViewSet(CreateListRetrieveDestroyViewSet):
+class TitleViewSet(SparseFieldsMixin, VersionedListMixin,
+                   VersionedRetrieveMixin, MultiGetMixin, FastListMixin,
+                   CreateListRetrieveDestroyViewSet):
     """Работа с заголовками."""
 
+    version_models = (Category, Genre, Review, Title)
+    cache_responses = True
+    fast_serializer_class = FastTitleSerializer
+    # Нужны курсору постраничного вывода.
+    sparse_required_fields = ('year', 'name')
+    includes = ('reviews_preview', 'comments_preview')
     serializer_class = TitleSerializer
-    queryset = Title.objects.all().annotate(
-        rating=Avg('reviews__score')
-    )
-    filter_backends = (DjangoFilterBackend,)
+    queryset = Title.objects.select_related(
+        'category'
+    ).prefetch_related('genre')
+    filter_backends = (DjangoFilterBackend, TitleOrderingFilter)
     filterset_class = TitleFilter
+    ordering_fields = ('rating', 'year', 'review_count', 'name')
     permission_classes = (IsAdminIsUserOrReadOnly,)
 
+    @property
+    def paginator(self):
+        """Пагинация по курсору для клиентов, которые её запросили."""
+        if TitleCursorPagination.is_requested(self.request):
+            self.pagination_class = TitleCursorPagination
+        return super().paginator
+
+    def get_queryset(self):
+        """Подгружает распределение оценок вместе с произведением."""
+        if self.action == 'rating_histogram':
+            return Title.objects.select_related('score_histogram')
+        return super().get_queryset()
+
+    def get_includes(self):
+        """Превью, запрошенные в ?include= вместе с произведением."""
+        if self.action != 'retrieve':
+            return set()
+        includes = set(
+            self.request.query_params.get('include', '').split(',')
+        ) & set(self.includes)
+        if 'comments_preview' in includes:
+            includes.add('reviews_preview')
+        return includes
+
+    def get_version_models(self):
+        """Превью зависят ещё от комментариев и их авторов."""
+        if self.get_includes():
+            return self.version_models + (Comment, CustomUser)
+        return self.version_models
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['include'] = self.get_includes()
+        return context
+
     def get_serializer_class(self):
         """Выбор нужного сериалайзера."""
+        if self.action == 'retrieve' and self.get_includes():
+            return TitlePageSerializer
         if self.action in ['list', 'retrieve']:
             return TitleSerializer
+        if self.action == 'bulk':
+            return TitleBulkSerializer
         return TitleChangeSerializer
 
+    def get_object(self):
+        """Добавляет к произведению запрошенные превью."""
+        title = super().get_object()
+        includes = self.get_includes()
+        if includes:
+            self.add_previews(title, includes)
+        return title
+
+    def add_previews(self, title, includes):
+        """Первые отзывы и комментарии к ним.
+
+        Отзывы и комментарии всех отзывов выбираются двумя запросами
+        вместе с именами авторов.
+        """
+        reviews = list(title.reviews.select_related('author').only(
+            'id', 'text', 'score', 'pub_date', 'title', 'author__username'
+        )[:REVIEWS_PREVIEW_SIZE])
+        if 'comments_preview' in includes:
+            first_comments = Comment.objects.filter(
+                reviews=OuterRef('reviews')
+            ).values('pk')[:COMMENTS_PREVIEW_SIZE]
+            comments = {review.pk: [] for review in reviews}
+            for comment in Comment.objects.filter(
+                reviews__in=list(comments), pk__in=Subquery(first_comments)
+            ).select_related('author').only(
+                'id', 'text', 'pub_date', 'reviews', 'author__username'
+            ):
+                comments[comment.reviews_id].append(comment)
+            for review in reviews:
+                review.comments_preview = comments[review.pk]
+        title.reviews_preview = reviews
+
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='bulk',
+        url_name='bulk',
+    )
+    def bulk(self, request):
+        """Создание множества произведений одним запросом."""
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path='export',
+        url_name='export',
+        permission_classes=(IsSuperUserOrIsAdmin,),
+        renderer_classes=(NDJSONRenderer,),
+    )
+    def export(self, request):
+        """Выгрузка всего каталога построчно в формате NDJSON."""
+        renderer = NDJSONRenderer()
+        lines = (
+            renderer.render(title)
+            for title in FastTitleSerializer.iterate(
+                Title.objects.all(), EXPORT_CHUNK_SIZE
+            )
+        )
+        return StreamingHttpResponse(lines, content_type=renderer.media_type)
+
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path='top',
+        url_name='top',
+    )
+    def top(self, request):
+        """Лучшие произведения по взвешенному рейтингу.
+
+        Можно сузить до категории и (или) жанра.
+        """
+        category = request.query_params.get('category')
+        genre = request.query_params.get('genre')
+        titles = Title.objects.select_related(
+            'category'
+        ).prefetch_related('genre')
+        if genre:
+            titles = titles.filter(leaderboard_entries__genre__slug=genre)
+            if category:
+                titles = titles.filter(category__slug=category)
+        elif category:
+            titles = titles.filter(
+                leaderboard_entries__category__slug=category,
+                leaderboard_entries__genre=None
+            )
+        else:
+            titles = titles.filter(
+                leaderboard_entries__category=None,
+                leaderboard_entries__genre=None
+            )
+        titles = titles.annotate(
+            bayesian_rating=F('leaderboard_entries__score')
+        ).order_by('-bayesian_rating', 'id')
+        limit = get_limit(request, LEADERBOARD_SIZE, LEADERBOARD_MAX_SIZE)
+        serializer = TopTitleSerializer(titles[:limit], many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path='trending',
+        url_name='trending',
+    )
+    def trending(self, request):
+        """Произведения с наибольшим числом недавних отзывов и комментариев.
+
+        Вес события вдвое уменьшается каждые TRENDING_HALF_LIFE секунд.
+        """
+        now = activity_time(timezone.now())
+        titles = Title.objects.filter(
+            activity_counter__score__gte=now + math.log(TRENDING_MIN_ACTIVITY)
+        ).select_related('category').prefetch_related('genre').annotate(
+            activity=Exp(F('activity_counter__score') - now)
+        ).order_by('-activity_counter__score', 'id')
+        limit = get_limit(request, TRENDING_SIZE, TRENDING_MAX_SIZE)
+        serializer = TrendingTitleSerializer(titles[:limit], many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(
+        detail=True,
+        methods=['get'],
+        url_path='similar',
+        url_name='similar',
+    )
+    def similar(self, request, pk=None):
+        """Похожие произведения из заранее рассчитанных списков."""
+        try:
+            pk = int(pk)
+        except ValueError:
+            raise Http404
+        titles = Title.objects.filter(
+            similar_entries__title_id=pk
+        ).select_related('category').prefetch_related('genre').annotate(
+            similarity=F('similar_entries__score')
+        ).order_by('-similarity', 'id')
+        limit = get_limit(request, SIMILAR_TITLES_SIZE, SIMILAR_TITLES_SIZE)
+        titles = list(titles[:limit])
+        if not titles and not Title.objects.filter(pk=pk).exists():
+            raise Http404
+        serializer = SimilarTitleSerializer(titles, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(
+        detail=True,
+        methods=['get'],
+        url_path='rating-histogram',
+        url_name='rating-histogram',
+    )
+    def rating_histogram(self, request, pk=None):
+        """Распределение оценок произведения по баллам."""
+        title = self.get_object()
+        try:
+            histogram = title.score_histogram
+        except ScoreHistogram.DoesNotExist:
+            histogram = ScoreHistogram(title=title)
+        serializer = ScoreHistogramSerializer(histogram)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class APIAutocomplete(APIView):
+    """Подсказки по началу названия произведения, жанра или категории."""
+
+    authentication_classes = ()
+    permission_classes = (permissions.AllowAny,)
+
+    def get(self, request):
+        matches = autocomplete_index.search(
+            request.query_params.get('q', ''),
+            get_limit(request, AUTOCOMPLETE_LIMIT, AUTOCOMPLETE_MAX_LIMIT)
+        )
+        results = [
+            {
+                'type': kind,
+                'id' if kind == 'title' else 'slug': identifier,
+                'name': name,
+            }
+            for kind, identifier, name in matches
+        ]
+        return Response({'results': results}, status=status.HTTP_200_OK)
+
 
 class APISignUp(APIView):
     """Создание нового пользователя."""
@@ -104,9 +363,13 @@ class APIToken(APIView):
         return Response(message, status=status.HTTP_200_OK)
 
 
-class UsersViewSet(CreateListRetrieveDestroyViewSet):
+class UsersViewSet(VersionedListMixin, VersionedRetrieveMixin, MultiGetMixin,
+                   CreateListRetrieveDestroyViewSet):
     """Работа с пользователем."""
 
+    version_models = (CustomUser,)
+    multi_get_param = 'usernames'
+    multi_get_field = 'username'
     queryset = CustomUser.objects.all()
     serializer_class = CustomUserSerializer
     permission_classes = (IsSuperUserOrIsAdmin,)
@@ -127,6 +390,24 @@ class UsersViewSet(CreateListRetrieveDestroyViewSet):
         serializer = CustomUserSerializer(request.user)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path='me/recommendations',
+        url_name='me-recommendations',
+        permission_classes=(permissions.IsAuthenticated,)
+    )
+    def recommendations(self, request):
+        """Заранее рассчитанные рекомендации текущему пользователю."""
+        titles = Title.objects.filter(
+            recommendation_entries__user=request.user
+        ).select_related('category').prefetch_related('genre').annotate(
+            predicted_score=F('recommendation_entries__score')
+        ).order_by('-predicted_score', 'id')
+        limit = get_limit(request, RECOMMENDATIONS_SIZE, RECOMMENDATIONS_SIZE)
+        serializer = RecommendedTitleSerializer(titles[:limit], many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
     @get_me.mapping.patch
     def path_me(self, request):
         """Обработка PATCH-запроса."""
@@ -140,20 +421,45 @@ class UsersViewSet(CreateListRetrieveDestroyViewSet):
             return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class ReviewViewSet(CreateListRetrieveDestroyViewSet):
+class ReviewViewSet(SparseFieldsMixin, VersionedListMixin,
+                    VersionedRetrieveMixin, FastListMixin,
+                    CreateListRetrieveDestroyViewSet):
     """Вьюсет для обьектов модели Reviews."""
 
+    version_models = (CustomUser, Review, Title)
+    fast_serializer_class = FastReviewSerializer
     serializer_class = ReviewSerializer
     permission_classes = (IsAdminIsModeratorIsAuthor,)
 
     def get_title(self):
-        """Возвращает объект текущего произведения."""
-        return get_object_or_404(Title, pk=self.kwargs.get('title_id'))
+        """Возвращает объект текущего произведения.
+
+        Произведение загружается один раз за запрос: его разделяют
+        perform_create и CurrentTitleDefault сериалайзера.
+        """
+        if not hasattr(self, '_title'):
+            self._title = get_object_or_404(
+                Title, pk=self.kwargs.get('title_id')
+            )
+        return self._title
 
     def get_queryset(self):
-        """Возвращает queryset c отзывами для текущего произведения."""
-        return self.get_title().reviews.all()
+        """Возвращает queryset c отзывами для текущего произведения.
+
+        Само произведение не загружается: достаточно проверить,
+        что оно существует, и отфильтровать отзывы по title_id.
+        """
+        title_id = self.kwargs.get('title_id')
+        if (not hasattr(self, '_title')
+                and not Title.objects.filter(pk=title_id).exists()):
+            raise Http404
+        return Review.objects.filter(title_id=title_id).select_related(
+            'author'
+        ).only(
+            'id', 'text', 'score', 'pub_date', 'title', 'author__username'
+        )
 
+    @transaction.atomic
     def perform_create(self, serializer):
         """Создает отзыв для текущего произведения,
         где автором является текущий пользователь."""
@@ -162,10 +468,22 @@ class ReviewViewSet(CreateListRetrieveDestroyViewSet):
             title=self.get_title()
         )
 
+    @transaction.atomic
+    def perform_update(self, serializer):
+        """Меняет отзыв вместе с рейтингом произведения."""
+        serializer.save()
 
-class CommentViewSet(CreateListRetrieveDestroyViewSet):
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        """Удаляет отзыв вместе с его оценкой в рейтинге."""
+        instance.delete()
+
+
+class CommentViewSet(SparseFieldsMixin, VersionedListMixin,
+                     VersionedRetrieveMixin, CreateListRetrieveDestroyViewSet):
     """Вьюсет для обьектов модели Comment."""
 
+    version_models = (Comment, CustomUser, Review)
     serializer_class = CommentSerializer
     permission_classes = (IsAdminIsModeratorIsAuthor,)
 
@@ -175,7 +493,9 @@ class CommentViewSet(CreateListRetrieveDestroyViewSet):
         )
 
     def get_queryset(self):
-        return self.get_reviews().comments.all()
+        return self.get_reviews().comments.select_related('author').only(
+            'id', 'text', 'pub_date', 'reviews', 'author__username'
+        )
 
     def perform_create(self, serializer):
         serializer.save(
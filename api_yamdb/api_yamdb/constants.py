@@ -19,3 +19,50 @@ SLUG_MAX_LENGTH = 50
 MIN_VALUE_VALIDATOR = 1
 
 MAX_VALUE_VALIDATOR = 10
+
+SCORES = range(MIN_VALUE_VALIDATOR, MAX_VALUE_VALIDATOR + 1)
+
+HISTOGRAM_PERCENTILES = (25, 50, 75, 90)
+
+AUTOCOMPLETE_LIMIT = 10
+
+AUTOCOMPLETE_MAX_LIMIT = 50
+
+LEADERBOARD_PRIOR_WEIGHT = 5
+
+LEADERBOARD_PRIOR_TIMEOUT = 60 * 60
+
+LEADERBOARD_SIZE = 10
+
+LEADERBOARD_MAX_SIZE = 100
+
+REVIEWS_PREVIEW_SIZE = 5
+
+COMMENTS_PREVIEW_SIZE = 3
+
+MULTI_GET_MAX_SIZE = 100
+
+# Наибольшее целое, которое принимают базы данных (BIGINT).
+MAX_INTEGER_KEY = 2 ** 63 - 1
+
+EXPORT_CHUNK_SIZE = 1000
+
+SIMILAR_TITLES_SIZE = 10
+
+RECOMMENDATIONS_SIZE = 10
+
+RECOMMENDATION_FACTORS = 32
+
+RECOMMENDATION_ITERATIONS = 10
+
+RECOMMENDATION_REGULARIZATION = 0.1
+
+TRENDING_HALF_LIFE = 24 * 60 * 60
+
+TRENDING_MIN_ACTIVITY = 0.01
+
+TRENDING_BACKFILL_HALF_LIVES = 20
+
+TRENDING_SIZE = 10
+
+TRENDING_MAX_SIZE = 100
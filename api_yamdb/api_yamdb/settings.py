@@ -1,5 +1,6 @@
 import os
 from datetime import timedelta
+from importlib.util import find_spec
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -33,6 +34,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'api.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -70,6 +72,45 @@ DATABASES = {
     }
 }
 
+# Поколения моделей и кеш ответов должны быть общими для всех процессов
+# приложения: у locmem они свои в каждом процессе, и изменения, сделанные
+# в одном, не сбрасывают кеш других. locmem годится только для одного
+# процесса, для нескольких серверов нужен memcached. Поколения растут
+# атомарным incr, поэтому файловый кеш выполняет его под блокировкой.
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'file')
+
+CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'file': {
+        'BACKEND': 'api.cache_backends.LockingFileBasedCache',
+        'LOCATION': os.getenv('CACHE_LOCATION', BASE_DIR / 'cache'),
+    },
+    'memcached': {
+        'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+        'LOCATION': os.getenv('CACHE_LOCATION', '127.0.0.1:11211'),
+    },
+}
+
+CACHES = {
+    'default': CACHE_BACKENDS[CACHE_BACKEND],
+}
+
+RESPONSE_CACHE_ALIAS = 'default'
+
+RESPONSE_CACHE_TIMEOUT = 60 * 60
+
+COMPRESSION_MIN_SIZE = 512
+
+RECOMMENDATIONS_DIR = os.getenv(
+    'RECOMMENDATIONS_DIR', BASE_DIR / 'recommendations'
+)
+
+FAST_READ_SERIALIZERS = (
+    os.getenv('FAST_READ_SERIALIZERS', 'false').lower() == 'true'
+)
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -104,6 +145,9 @@ EMAIL_FILE_PATH = os.path.join(BASE_DIR, 'sent_emails')
 
 EMAIL_PROJECT = 'vitalii.cheremisov@mail.ru'
 
+# MessagePack доступен, только если установлен пакет msgpack.
+MSGPACK_AVAILABLE = find_spec('msgpack') is not None
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework_simplejwt.authentication.JWTAuthentication',
@@ -113,6 +157,17 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": PAGE_PAGINATION_NUMBER,
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.v1.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ] + (['api.v1.renderers.MessagePackRenderer']
+         if MSGPACK_AVAILABLE else []),
+    'DEFAULT_PARSER_CLASSES': [
+        'rest_framework.parsers.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ] + (['api.v1.renderers.MessagePackParser']
+         if MSGPACK_AVAILABLE else []),
 }
 
 SIMPLE_JWT = {
@@ -22,9 +22,11 @@ class GenreAdmin(admin.ModelAdmin):
 
 @admin.register(Title)
 class TitleAdmin(admin.ModelAdmin):
-    list_display = ('name', 'year', 'description', 'category')
+    list_display = ('name', 'year', 'description', 'category',
+                    'rating', 'review_count')
     search_fields = ('name', 'year', 'description', 'genre', 'category')
     list_filter = ('year', 'genre', 'category')
+    readonly_fields = ('rating', 'review_count', 'score_sum')
 
 
 @admin.register(Review)
@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api_yamdb.constants import (RECOMMENDATION_FACTORS,
+                                 RECOMMENDATION_ITERATIONS,
+                                 RECOMMENDATION_REGULARIZATION,
+                                 RECOMMENDATIONS_SIZE)
+from reviews.recommendations import FactorModel, is_available
+
+
+class Command(BaseCommand):
+    help = ('Расчёт персональных рекомендаций матричным разложением '
+            'оценок. Без --full дообучает сохранённые факторы только '
+            'по новым отзывам.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Обучить факторы заново по всем отзывам.'
+        )
+        parser.add_argument(
+            '--factors',
+            type=int,
+            default=RECOMMENDATION_FACTORS,
+            help='Размерность факторов при полном обучении.'
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=RECOMMENDATION_ITERATIONS,
+            help='Количество проходов ALS при полном обучении.'
+        )
+        parser.add_argument(
+            '--regularization',
+            type=float,
+            default=RECOMMENDATION_REGULARIZATION,
+            help='Коэффициент регуляризации при полном обучении.'
+        )
+        parser.add_argument(
+            '--size',
+            type=int,
+            default=RECOMMENDATIONS_SIZE,
+            help='Количество рекомендаций для каждого пользователя.'
+        )
+
+    def handle(self, *args, **options):
+        if not is_available():
+            raise CommandError('Для расчёта нужны пакеты numpy и scipy.')
+        model = FactorModel()
+        if options['full'] or not model.exists():
+            users = model.train(
+                options['factors'],
+                options['iterations'],
+                options['regularization']
+            )
+        else:
+            users = model.load().fold_in()
+            if not len(users):
+                self.stdout.write('Новых отзывов нет.')
+                return
+        created = model.save().recommend(users, options['size'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Пользователей: {len(users)}, рекомендаций: {created}'
+        ))
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api_yamdb.constants import SIMILAR_TITLES_SIZE
+from reviews.recommendations import is_available, update_similar_titles
+
+BLOCK_SIZE = 256
+
+
+class Command(BaseCommand):
+    help = ('Расчёт похожих произведений по оценкам '
+            'из отзывов пользователей.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top-k',
+            type=int,
+            default=SIMILAR_TITLES_SIZE,
+            help='Количество похожих произведений для каждого.'
+        )
+        parser.add_argument(
+            '--block-size',
+            type=int,
+            default=BLOCK_SIZE,
+            help='Количество строк матрицы сходства, считаемых за раз.'
+        )
+
+    def handle(self, *args, **options):
+        if not is_available():
+            raise CommandError('Для расчёта нужны пакеты numpy и scipy.')
+        created = update_similar_titles(
+            options['top_k'], options['block_size']
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Сохранено пар похожих произведений: {created}'
+        ))
@@ -4,6 +4,8 @@ from django.conf import settings
 from django.core.management.base import BaseCommand
 
 from reviews.models import Category, Comment, CustomUser, Genre, Review, Title
+from reviews.utils import (recalculate_histograms, recalculate_ratings,
+                           update_leaderboards)
 
 FILES_CSV = {
     Category: 'category.csv',
@@ -32,6 +34,12 @@ class Command(BaseCommand):
                     }
                     objects_to_create.append(model(**field_values))
                 model.objects.bulk_create(objects_to_create)
+            if model is Review:
+                title_ids = {review.title_id for review in objects_to_create}
+                titles = Title.objects.filter(pk__in=title_ids)
+                recalculate_ratings(titles)
+                recalculate_histograms(titles)
+                update_leaderboards(title_ids)
 
             self.stdout.write(self.style.SUCCESS(
                 'Данные успешно загружены из CSV файла в базу данных'
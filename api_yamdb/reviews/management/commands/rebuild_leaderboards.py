@@ -0,0 +1,36 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+
+from reviews.models import Title
+from reviews.utils import PRIOR_MEAN_KEY, get_prior_mean, update_leaderboards
+
+CHUNK_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = ('Пересчёт рейтингов лучших произведений '
+            'по текущей средней оценке.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=CHUNK_SIZE,
+            help='Количество произведений, пересчитываемых за один раз.'
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        cache.delete(PRIOR_MEAN_KEY)
+        prior_mean = get_prior_mean()
+        ids = Title.objects.order_by('pk').values_list('pk', flat=True)
+        last_id = 0
+        while True:
+            chunk = list(ids.filter(pk__gt=last_id)[:chunk_size])
+            if not chunk:
+                break
+            update_leaderboards(chunk, prior_mean)
+            last_id = chunk[-1]
+        self.stdout.write(self.style.SUCCESS(
+            f'Рейтинги лучших пересчитаны, средняя оценка {prior_mean:.2f}'
+        ))
@@ -0,0 +1,54 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from api_yamdb.constants import (TRENDING_BACKFILL_HALF_LIVES,
+                                 TRENDING_HALF_LIFE)
+from reviews.models import Comment, Review, TitleActivity
+from reviews.utils import activity_time, add_activity
+
+
+class Command(BaseCommand):
+    help = ('Пересчёт счётчиков активности произведений '
+            'по датам отзывов и комментариев.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--half-lives',
+            type=int,
+            default=TRENDING_BACKFILL_HALF_LIVES,
+            help=('За сколько периодов полураспада учитывать события: '
+                  'более старые почти не влияют на счётчики.')
+        )
+
+    def handle(self, *args, **options):
+        since = timezone.now() - timedelta(
+            seconds=TRENDING_HALF_LIFE * options['half_lives']
+        )
+        events = (
+            Review.objects.filter(
+                pub_date__gte=since, title__isnull=False
+            ).order_by().values_list('title_id', 'pub_date'),
+            Comment.objects.filter(
+                pub_date__gte=since, reviews__title__isnull=False
+            ).order_by().values_list('reviews__title_id', 'pub_date'),
+        )
+        scores = {}
+        for queryset in events:
+            for title_id, pub_date in queryset.iterator():
+                time = activity_time(pub_date)
+                scores[title_id] = (
+                    time if title_id not in scores
+                    else add_activity(scores[title_id], time)
+                )
+        with transaction.atomic():
+            TitleActivity.objects.all().delete()
+            TitleActivity.objects.bulk_create(
+                TitleActivity(title_id=title_id, score=score)
+                for title_id, score in scores.items()
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f'Активность пересчитана для {len(scores)} произведений'
+        ))
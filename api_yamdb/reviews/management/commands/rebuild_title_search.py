@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from reviews.search import create_search_index
+
+
+class Command(BaseCommand):
+    help = 'Перестроение полнотекстового индекса произведений.'
+
+    def handle(self, *args, **options):
+        create_search_index()
+        self.stdout.write(self.style.SUCCESS(
+            'Полнотекстовый индекс произведений перестроен'
+        ))
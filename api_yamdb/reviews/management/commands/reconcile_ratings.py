@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from reviews.models import Title
+from reviews.utils import recalculate_histograms, recalculate_ratings
+
+CHUNK_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = ('Пересчёт хранимых рейтингов и распределений оценок '
+            'произведений по отзывам.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=CHUNK_SIZE,
+            help='Количество произведений, пересчитываемых за один раз.'
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        ids = Title.objects.order_by('pk').values_list('pk', flat=True)
+        last_id = 0
+        updated = 0
+        while True:
+            chunk = list(ids.filter(pk__gt=last_id)[:chunk_size])
+            if not chunk:
+                break
+            titles = Title.objects.filter(pk__in=chunk)
+            with transaction.atomic():
+                updated += recalculate_ratings(titles)
+                recalculate_histograms(titles)
+            last_id = chunk[-1]
+        self.stdout.write(self.style.SUCCESS(
+            f'Пересчитан рейтинг {updated} произведений'
+        ))
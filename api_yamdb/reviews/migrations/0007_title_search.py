@@ -0,0 +1,55 @@
+from django.db import migrations
+
+# SQL записан прямо здесь, а не взят из reviews.search, чтобы изменения
+# кода приложения не меняли то, что делает эта миграция.
+CREATE_INDEX = (
+    'CREATE VIRTUAL TABLE IF NOT EXISTS reviews_title_fts USING fts5('
+    "name, description, content='reviews_title', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    'CREATE TRIGGER IF NOT EXISTS reviews_title_fts_ai '
+    'AFTER INSERT ON reviews_title BEGIN '
+    'INSERT INTO reviews_title_fts(rowid, name, description) '
+    'VALUES (new.id, new.name, new.description); END',
+    'CREATE TRIGGER IF NOT EXISTS reviews_title_fts_ad '
+    'AFTER DELETE ON reviews_title BEGIN '
+    'INSERT INTO reviews_title_fts(reviews_title_fts, rowid, name, '
+    "description) VALUES ('delete', old.id, old.name, old.description); "
+    'END',
+    'CREATE TRIGGER IF NOT EXISTS reviews_title_fts_au '
+    'AFTER UPDATE OF name, description ON reviews_title BEGIN '
+    'INSERT INTO reviews_title_fts(reviews_title_fts, rowid, name, '
+    "description) VALUES ('delete', old.id, old.name, old.description); "
+    'INSERT INTO reviews_title_fts(rowid, name, description) '
+    'VALUES (new.id, new.name, new.description); END',
+    "INSERT INTO reviews_title_fts(reviews_title_fts) VALUES ('rebuild')",
+)
+
+DROP_INDEX = (
+    'DROP TRIGGER IF EXISTS reviews_title_fts_ai',
+    'DROP TRIGGER IF EXISTS reviews_title_fts_ad',
+    'DROP TRIGGER IF EXISTS reviews_title_fts_au',
+    'DROP TABLE IF EXISTS reviews_title_fts',
+)
+
+
+def run_on_sqlite(statements):
+    """Полнотекстовый индекс ведётся только в SQLite."""
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0006_title_year_name_id_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_on_sqlite(CREATE_INDEX), run_on_sqlite(DROP_INDEX)
+        ),
+    ]
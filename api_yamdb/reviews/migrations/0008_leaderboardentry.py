@@ -0,0 +1,81 @@
+# Generated by Django 3.2 on 2026-10-18 13:29
+
+from collections import defaultdict
+
+from django.db import migrations, models
+from django.db.models import Sum
+import django.db.models.deletion
+
+# Вес априорной средней на момент миграции: формула скопирована сюда из
+# reviews.utils.bayesian_rating, чтобы данные миграции не зависели от
+# последующих изменений кода приложения.
+PRIOR_WEIGHT = 5
+
+
+def bayesian_rating(score_sum, review_count, prior_mean):
+    return ((PRIOR_WEIGHT * prior_mean + score_sum)
+            / (PRIOR_WEIGHT + review_count))
+
+
+def fill_leaderboards(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    LeaderboardEntry = apps.get_model('reviews', 'LeaderboardEntry')
+    totals = Title.objects.aggregate(
+        score_sum=Sum('score_sum'), review_count=Sum('review_count')
+    )
+    if not totals['review_count']:
+        return
+    prior_mean = totals['score_sum'] / totals['review_count']
+    genres = defaultdict(list)
+    for title_id, genre_id in Title.genre.through.objects.values_list(
+        'title_id', 'genre_id'
+    ):
+        genres[title_id].append(genre_id)
+    entries = []
+    for title in Title.objects.filter(review_count__gt=0):
+        score = bayesian_rating(
+            title.score_sum, title.review_count, prior_mean
+        )
+        entries.append(LeaderboardEntry(title=title, score=score))
+        if title.category_id:
+            entries.append(LeaderboardEntry(
+                title=title, category_id=title.category_id, score=score
+            ))
+        entries.extend(
+            LeaderboardEntry(title=title, genre_id=genre_id, score=score)
+            for genre_id in genres[title.pk]
+        )
+    LeaderboardEntry.objects.bulk_create(entries)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0007_title_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaderboardEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField(verbose_name='Взвешенный рейтинг')),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='reviews.category', verbose_name='Категория')),
+                ('genre', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='reviews.genre', verbose_name='Жанр')),
+                ('title', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_entries', to='reviews.title', verbose_name='Произведение')),
+            ],
+            options={
+                'verbose_name': 'Место в рейтинге',
+                'verbose_name_plural': 'Рейтинги лучших',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='leaderboardentry',
+            index=models.Index(fields=['category', 'genre', '-score'], name='leaderboard_board_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leaderboardentry',
+            index=models.Index(fields=['genre', '-score'], name='leaderboard_genre_score_idx'),
+        ),
+        migrations.RunPython(fill_leaderboards, migrations.RunPython.noop),
+    ]
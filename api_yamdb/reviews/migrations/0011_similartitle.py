@@ -0,0 +1,31 @@
+# Generated by Django 3.2 on 2026-10-18 13:50
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0010_title_category_year_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SimilarTitle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField(verbose_name='Сходство')),
+                ('similar', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar_entries', to='reviews.title', verbose_name='Похожее произведение')),
+                ('title', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='reviews.title', verbose_name='Произведение')),
+            ],
+            options={
+                'verbose_name': 'Похожее произведение',
+                'verbose_name_plural': 'Похожие произведения',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='similartitle',
+            index=models.Index(fields=['title', '-score'], name='similar_title_score_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 3.2 on 2026-10-18 14:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0012_recommendation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TitleActivity',
+            fields=[
+                ('title', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='activity_counter', serialize=False, to='reviews.title', verbose_name='Произведение')),
+                ('score', models.FloatField(verbose_name='Логарифм активности')),
+            ],
+            options={
+                'verbose_name': 'Активность произведения',
+                'verbose_name_plural': 'Активность произведений',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='titleactivity',
+            index=models.Index(fields=['-score'], name='title_activity_score_idx'),
+        ),
+    ]
@@ -1,3 +1,5 @@
+import math
+
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
@@ -70,9 +72,51 @@ class Title(models.Model):
         blank=True,
         null=True
     )
+    rating = models.FloatField(
+        'Рейтинг',
+        blank=True,
+        null=True,
+        editable=False
+    )
+    review_count = models.PositiveIntegerField(
+        'Количество отзывов',
+        default=0,
+        editable=False
+    )
+    score_sum = models.PositiveIntegerField(
+        'Сумма оценок',
+        default=0,
+        editable=False
+    )
 
     class Meta:
         ordering = ('-year', 'name')
+        indexes = (
+            models.Index(
+                fields=('-year', 'name', 'id'),
+                name='title_year_name_id_idx'
+            ),
+            models.Index(
+                fields=('rating', 'id'),
+                name='title_rating_id_idx'
+            ),
+            models.Index(
+                fields=('review_count', 'id'),
+                name='title_review_count_id_idx'
+            ),
+            models.Index(
+                fields=('name', 'id'),
+                name='title_name_id_idx'
+            ),
+            models.Index(
+                fields=('year', 'id'),
+                name='title_year_id_idx'
+            ),
+            models.Index(
+                fields=('category', 'year'),
+                name='title_category_year_idx'
+            ),
+        )
         default_related_name = 'titles'
         verbose_name = 'Произведение'
         verbose_name_plural = 'Произведения'
@@ -166,3 +210,206 @@ class Comment(models.Model):
 
     def __str__(self):
         return self.text[:constants.SHORT_TEXT_LENGTH]
+
+
+class ScoreHistogram(models.Model):
+    """Счётчики оценок произведения, по одному на каждый балл."""
+
+    title = models.OneToOneField(
+        Title,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='score_histogram',
+        verbose_name='Произведение'
+    )
+
+    class Meta:
+        verbose_name = 'Распределение оценок'
+        verbose_name_plural = 'Распределения оценок'
+
+    def __str__(self):
+        return str(self.title)
+
+    @staticmethod
+    def field_name(score):
+        return f'score_{score}'
+
+    @property
+    def counts(self):
+        """Количество отзывов для каждого балла."""
+        return {
+            score: getattr(self, self.field_name(score))
+            for score in constants.SCORES
+        }
+
+    def percentile(self, percent):
+        """Оценка, ниже или равной которой поставлено percent% оценок."""
+        counts = self.counts
+        rank = math.ceil(sum(counts.values()) * percent / 100)
+        if not rank:
+            return None
+        total = 0
+        for score, count in counts.items():
+            total += count
+            if total >= rank:
+                return score
+
+    @property
+    def median(self):
+        """Медиана оценок."""
+        count = sum(self.counts.values())
+        if not count:
+            return None
+        low = self.percentile(50)
+        if count % 2:
+            return low
+        total = 0
+        for score, score_count in self.counts.items():
+            total += score_count
+            if total > count // 2:
+                return (low + score) / 2
+
+
+for score in constants.SCORES:
+    ScoreHistogram.add_to_class(
+        ScoreHistogram.field_name(score),
+        models.PositiveIntegerField(f'Оценка {score}', default=0)
+    )
+
+
+class LeaderboardEntry(models.Model):
+    """Место произведения в рейтинге лучших.
+
+    Для каждого произведения с отзывами хранится строка общего рейтинга
+    (без категории и жанра), строка рейтинга его категории и по строке
+    на каждый его жанр.
+    """
+
+    title = models.ForeignKey(
+        Title,
+        on_delete=models.CASCADE,
+        related_name='leaderboard_entries',
+        verbose_name='Произведение'
+    )
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='Категория',
+        blank=True,
+        null=True
+    )
+    genre = models.ForeignKey(
+        Genre,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='Жанр',
+        blank=True,
+        null=True
+    )
+    score = models.FloatField('Взвешенный рейтинг')
+
+    class Meta:
+        verbose_name = 'Место в рейтинге'
+        verbose_name_plural = 'Рейтинги лучших'
+        indexes = (
+            models.Index(
+                fields=('category', 'genre', '-score'),
+                name='leaderboard_board_score_idx'
+            ),
+            models.Index(
+                fields=('genre', '-score'),
+                name='leaderboard_genre_score_idx'
+            ),
+        )
+
+    def __str__(self):
+        return str(self.title)
+
+
+class SimilarTitle(models.Model):
+    """Похожее произведение из заранее рассчитанного списка соседей."""
+
+    title = models.ForeignKey(
+        Title,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='Произведение'
+    )
+    similar = models.ForeignKey(
+        Title,
+        on_delete=models.CASCADE,
+        related_name='similar_entries',
+        verbose_name='Похожее произведение'
+    )
+    score = models.FloatField('Сходство')
+
+    class Meta:
+        verbose_name = 'Похожее произведение'
+        verbose_name_plural = 'Похожие произведения'
+        indexes = (
+            models.Index(
+                fields=('title', '-score'),
+                name='similar_title_score_idx'
+            ),
+        )
+
+
+class Recommendation(models.Model):
+    """Произведение из заранее рассчитанных рекомендаций пользователю."""
+
+    user = models.ForeignKey(
+        CustomUser,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='Пользователь'
+    )
+    title = models.ForeignKey(
+        Title,
+        on_delete=models.CASCADE,
+        related_name='recommendation_entries',
+        verbose_name='Произведение'
+    )
+    score = models.FloatField('Ожидаемая оценка')
+
+    class Meta:
+        verbose_name = 'Рекомендация'
+        verbose_name_plural = 'Рекомендации'
+        indexes = (
+            models.Index(
+                fields=('user', '-score'),
+                name='recommendation_user_score_idx'
+            ),
+        )
+
+
+class TitleActivity(models.Model):
+    """Затухающий счётчик новых отзывов и комментариев к произведению.
+
+    Хранится логарифм суммы exp(t / τ) по моментам t всех событий,
+    где τ = TRENDING_HALF_LIFE / ln 2. Все счётчики затухают с одной
+    скоростью, поэтому их порядок со временем не меняется и держится
+    индексом, а текущее значение счётчика равно exp(score - now / τ).
+    """
+
+    title = models.OneToOneField(
+        Title,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='activity_counter',
+        verbose_name='Произведение'
+    )
+    score = models.FloatField('Логарифм активности')
+
+    class Meta:
+        verbose_name = 'Активность произведения'
+        verbose_name_plural = 'Активность произведений'
+        indexes = (
+            models.Index(
+                fields=('-score',),
+                name='title_activity_score_idx'
+            ),
+        )
+
+    def __str__(self):
+        return str(self.title)
@@ -0,0 +1,373 @@
+import json
+import os
+from itertools import chain
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+
+from reviews.models import Recommendation, Review, SimilarTitle, Title
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:
+    np = sparse = None
+
+READ_CHUNK_SIZE = 10000
+
+# Пользователей или произведений на одно решение систем ALS.
+SOLVE_CHUNK_SIZE = 1024
+
+# Пользователей на один расчёт оценок всех произведений.
+RECOMMEND_CHUNK_SIZE = 256
+
+# Проходов ALS по затронутым строкам при дообучении.
+FOLD_IN_ITERATIONS = 2
+
+FACTOR_ARRAYS = ('user_ids', 'user_factors', 'title_ids', 'title_factors')
+STATE_FILE = 'state.json'
+
+
+def is_available():
+    """Установлены ли numpy и scipy для расчётов."""
+    return np is not None and sparse is not None
+
+
+def load_reviews(queryset=None):
+    """Массивы id авторов, id произведений и оценок отзывов."""
+    if queryset is None:
+        queryset = Review.objects.all()
+    rows = queryset.filter(title__isnull=False).order_by().values_list(
+        'author_id', 'title_id', 'score'
+    ).iterator(chunk_size=READ_CHUNK_SIZE)
+    data = np.fromiter(chain.from_iterable(rows), dtype=np.int64)
+    data = data.reshape(-1, 3)
+    return data[:, 0], data[:, 1], data[:, 2].astype(np.float64)
+
+
+def centred_matrix(user_ids, title_ids, scores):
+    """Разреженная матрица «произведение × автор» центрированных оценок.
+
+    Из каждой оценки вычитается средняя оценка её автора. Возвращает
+    ещё id авторов и произведений в порядке столбцов и строк.
+    """
+    users, user_index = np.unique(user_ids, return_inverse=True)
+    titles, title_index = np.unique(title_ids, return_inverse=True)
+    means = (np.bincount(user_index, weights=scores)
+             / np.bincount(user_index))
+    matrix = sparse.csr_matrix(
+        (scores - means[user_index], (title_index, user_index)),
+        shape=(len(titles), len(users))
+    )
+    return users, titles, matrix
+
+
+def iter_similar_titles(top_k, block_size):
+    """Тройки (произведение, похожее, сходство) по top_k на произведение.
+
+    Сходство — косинус центрированных оценок. Матрица сходства
+    считается блоками по block_size строк, чтобы не держать в памяти
+    всю матрицу «произведение × произведение».
+    """
+    user_ids, title_ids, scores = load_reviews()
+    if not len(scores):
+        return
+    _, titles, matrix = centred_matrix(user_ids, title_ids, scores)
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    inverse = np.divide(
+        1.0, norms, out=np.zeros_like(norms), where=norms > 0
+    )
+    matrix = sparse.diags(inverse) @ matrix
+    transposed = matrix.T.tocsc()
+    count = min(top_k, len(titles) - 1)
+    if count <= 0:
+        return
+    for start in range(0, len(titles), block_size):
+        block = (matrix[start:start + block_size] @ transposed).toarray()
+        rows = np.arange(len(block))
+        block[rows, rows + start] = -np.inf
+        best = np.argpartition(-block, count - 1, axis=1)[:, :count]
+        best_scores = np.take_along_axis(block, best, axis=1)
+        order = np.argsort(-best_scores, axis=1)
+        best = np.take_along_axis(best, order, axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        for row, (columns, values) in enumerate(zip(best, best_scores)):
+            for column, score in zip(columns, values):
+                if score > 0:
+                    yield titles[start + row], titles[column], score
+
+
+def update_similar_titles(top_k, block_size):
+    """Заменяет сохранённые списки похожих произведений новыми.
+
+    Всё считается до начала транзакции: пока она открыта, SQLite
+    не даёт писать в базу никому, поэтому в ней остаются только
+    удаление старых пар и вставка новых. Пары с произведениями,
+    удалёнными за время расчёта, пропускаются. Возвращает количество
+    сохранённых пар.
+    """
+    pairs = [
+        (int(title_id), int(similar_id), float(score))
+        for title_id, similar_id, score in iter_similar_titles(
+            top_k, block_size
+        )
+    ]
+    with transaction.atomic():
+        existing = set(Title.objects.values_list('pk', flat=True))
+        SimilarTitle.objects.all().delete()
+        return len(SimilarTitle.objects.bulk_create(
+            (
+                SimilarTitle(title_id=title_id, similar_id=similar_id,
+                             score=score)
+                for title_id, similar_id, score in pairs
+                if title_id in existing and similar_id in existing
+            ),
+            batch_size=READ_CHUNK_SIZE
+        ))
+
+
+def solve_factors(rows, columns, column_factors, values, count,
+                  regularization):
+    """Шаг ALS: факторы count строк при фиксированных факторах столбцов.
+
+    Для каждой строки решается регуляризованная задача наименьших
+    квадратов по её оценкам: матрица Грама оценок строки считается
+    одним умножением BLAS, а системы решаются пачками по
+    SOLVE_CHUNK_SIZE строк. Строки без оценок получают нулевые факторы.
+    """
+    size = column_factors.shape[1]
+    factors = np.zeros((count, size))
+    order = np.argsort(rows, kind='stable')
+    rows, columns, values = rows[order], columns[order], values[order]
+    present, starts = np.unique(rows, return_index=True)
+    bounds = np.append(starts, len(rows))
+    identity = regularization * np.eye(size)
+    for start in range(0, len(present), SOLVE_CHUNK_SIZE):
+        chunk = present[start:start + SOLVE_CHUNK_SIZE]
+        chunk_bounds = bounds[start:start + len(chunk) + 1]
+        first = chunk_bounds[0]
+        other = column_factors[columns[first:chunk_bounds[-1]]]
+        chunk_values = values[first:chunk_bounds[-1]]
+        gram = np.tile(identity, (len(chunk), 1, 1))
+        target = np.empty((len(chunk), size))
+        for offset, (low, high) in enumerate(
+            zip(chunk_bounds[:-1] - first, chunk_bounds[1:] - first)
+        ):
+            block = other[low:high]
+            gram[offset] += block.T @ block
+            target[offset] = block.T @ chunk_values[low:high]
+        factors[chunk] = np.linalg.solve(gram, target[..., None])[..., 0]
+    return factors
+
+
+def index_of(ids, values):
+    """Позиции values в отсортированном массиве ids."""
+    return np.searchsorted(ids, values)
+
+
+def with_new_ids(ids, factors, new_ids):
+    """Добавляет нулевые факторы для новых id, сохраняя порядок ids."""
+    new_ids = np.setdiff1d(new_ids, ids)
+    if not len(new_ids):
+        return ids, factors
+    ids = np.concatenate((ids, new_ids))
+    factors = np.concatenate(
+        (factors, np.zeros((len(new_ids), factors.shape[1])))
+    )
+    order = np.argsort(ids, kind='stable')
+    return ids[order], factors[order]
+
+
+class FactorModel:
+    """Факторы пользователей и произведений в файлах .npy.
+
+    Файлы читаются через memory-map, поэтому расчёт рекомендаций
+    не загружает в память все факторы сразу. Запись идёт через
+    временные файлы и os.replace.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory or settings.RECOMMENDATIONS_DIR)
+        self.arrays = {}
+        self.state = {}
+
+    def exists(self):
+        return (self.directory / STATE_FILE).exists()
+
+    def load(self):
+        with open(self.directory / STATE_FILE, encoding='utf-8') as file:
+            self.state = json.load(file)
+        self.arrays = {
+            name: np.load(self.directory / f'{name}.npy', mmap_mode='r')
+            for name in FACTOR_ARRAYS
+        }
+        return self
+
+    def save(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for name in FACTOR_ARRAYS:
+            path = self.directory / f'{name}.npy'
+            temporary = self.directory / f'{name}.tmp.npy'
+            np.save(temporary, self.arrays[name])
+            os.replace(temporary, path)
+        temporary = self.directory / f'{STATE_FILE}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump(self.state, file)
+        os.replace(temporary, self.directory / STATE_FILE)
+        return self.load()
+
+    def train(self, factors, iterations, regularization, seed=0):
+        """Обучение с нуля по всем отзывам.
+
+        Возвращает id пользователей, для которых нужны рекомендации.
+        """
+        last_review_id = Review.objects.aggregate(last=Max('id'))['last']
+        user_ids, title_ids, scores = load_reviews(
+            Review.objects.filter(pk__lte=last_review_id or 0)
+        )
+        users, user_index = np.unique(user_ids, return_inverse=True)
+        titles, title_index = np.unique(title_ids, return_inverse=True)
+        mean = float(scores.mean()) if len(scores) else 0.0
+        values = scores - mean
+        title_factors = np.random.default_rng(seed).normal(
+            scale=0.1, size=(len(titles), factors)
+        )
+        user_factors = np.zeros((len(users), factors))
+        for _ in range(iterations):
+            user_factors = solve_factors(
+                user_index, title_index, title_factors, values,
+                len(users), regularization
+            )
+            title_factors = solve_factors(
+                title_index, user_index, user_factors, values,
+                len(titles), regularization
+            )
+        self.arrays = {
+            'user_ids': users,
+            'user_factors': user_factors,
+            'title_ids': titles,
+            'title_factors': title_factors,
+        }
+        self.state = {
+            'mean': mean,
+            'factors': factors,
+            'regularization': regularization,
+            'last_review_id': last_review_id or 0,
+        }
+        return users
+
+    def fold_in(self):
+        """Дообучение по отзывам, появившимся после прошлого расчёта.
+
+        Пересчитываются только факторы авторов новых отзывов и
+        оценённых в них произведений, остальные не меняются.
+        Изменённые и удалённые отзывы учитывает только train().
+        Возвращает id пользователей, для которых нужны рекомендации.
+        """
+        last_review_id = Review.objects.aggregate(last=Max('id'))['last']
+        new_reviews = Review.objects.filter(
+            pk__gt=self.state['last_review_id'],
+            pk__lte=last_review_id or 0
+        )
+        new_users, new_titles, _ = load_reviews(new_reviews)
+        if not len(new_users):
+            return new_users
+        new_users, new_titles = np.unique(new_users), np.unique(new_titles)
+        users, user_factors = with_new_ids(
+            self.arrays['user_ids'], np.array(self.arrays['user_factors']),
+            new_users
+        )
+        titles, title_factors = with_new_ids(
+            self.arrays['title_ids'],
+            np.array(self.arrays['title_factors']), new_titles
+        )
+        regularization = self.state['regularization']
+        mean = self.state['mean']
+        user_ratings = load_reviews(Review.objects.filter(
+            pk__lte=last_review_id, author_id__in=new_users.tolist()
+        ))
+        title_ratings = load_reviews(Review.objects.filter(
+            pk__lte=last_review_id, title_id__in=new_titles.tolist()
+        ))
+        for _ in range(FOLD_IN_ITERATIONS):
+            author_ids, title_ids, scores = user_ratings
+            user_factors[index_of(users, new_users)] = solve_factors(
+                index_of(new_users, author_ids),
+                index_of(titles, title_ids), title_factors,
+                scores - mean, len(new_users), regularization
+            )
+            author_ids, title_ids, scores = title_ratings
+            title_factors[index_of(titles, new_titles)] = solve_factors(
+                index_of(new_titles, title_ids),
+                index_of(users, author_ids), user_factors,
+                scores - mean, len(new_titles), regularization
+            )
+        self.arrays = {
+            'user_ids': users,
+            'user_factors': user_factors,
+            'title_ids': titles,
+            'title_factors': title_factors,
+        }
+        self.state['last_review_id'] = last_review_id
+        return new_users
+
+    def recommend(self, user_ids, size):
+        """Сохраняет пользователям лучшие неоценённые ими произведения.
+
+        Каждому из user_ids достаётся до size произведений с наибольшей
+        ожидаемой оценкой, прежние рекомендации заменяются. Произведения,
+        удалённые после расчёта факторов, не рекомендуются.
+        Возвращает количество сохранённых рекомендаций.
+        """
+        users = self.arrays['user_ids']
+        titles = self.arrays['title_ids']
+        title_factors = self.arrays['title_factors']
+        deleted = ~np.isin(titles, np.fromiter(
+            Title.objects.values_list('pk', flat=True).iterator(),
+            dtype=np.int64
+        ))
+        count = min(size, int(len(titles) - deleted.sum()))
+        if count <= 0:
+            return 0
+        created = 0
+        for start in range(0, len(user_ids), RECOMMEND_CHUNK_SIZE):
+            chunk = np.asarray(user_ids[start:start + RECOMMEND_CHUNK_SIZE])
+            scores = self.state['mean'] + (
+                self.arrays['user_factors'][index_of(users, chunk)]
+                @ title_factors.T
+            )
+            author_ids, title_ids, _ = load_reviews(
+                Review.objects.filter(author_id__in=chunk.tolist())
+            )
+            known = np.isin(title_ids, titles)
+            scores[
+                index_of(chunk, author_ids[known]),
+                index_of(titles, title_ids[known])
+            ] = -np.inf
+            scores[:, deleted] = -np.inf
+            best = np.argpartition(-scores, count - 1, axis=1)[:, :count]
+            best_scores = np.take_along_axis(scores, best, axis=1)
+            entries = [
+                Recommendation(
+                    user_id=int(user_id),
+                    title_id=int(titles[column]),
+                    score=float(score)
+                )
+                for user_id, columns, values in zip(chunk, best, best_scores)
+                for column, score in zip(columns, values)
+                if np.isfinite(score)
+            ]
+            with transaction.atomic():
+                Recommendation.objects.filter(
+                    user_id__in=chunk.tolist()
+                ).delete()
+                # Произведение могло быть удалено и во время расчёта.
+                existing = set(Title.objects.filter(
+                    pk__in={entry.title_id for entry in entries}
+                ).values_list('pk', flat=True))
+                created += len(Recommendation.objects.bulk_create(
+                    entry for entry in entries if entry.title_id in existing
+                ))
+        return created
@@ -0,0 +1,80 @@
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = 'reviews_title_fts'
+
+FTS_CREATE = (
+    f'CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5('
+    "name, description, content='reviews_title', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    f'CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai '
+    'AFTER INSERT ON reviews_title BEGIN '
+    f'INSERT INTO {FTS_TABLE}(rowid, name, description) '
+    'VALUES (new.id, new.name, new.description); END',
+    f'CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad '
+    'AFTER DELETE ON reviews_title BEGIN '
+    f'INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description) '
+    "VALUES ('delete', old.id, old.name, old.description); END",
+    f'CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au '
+    'AFTER UPDATE OF name, description ON reviews_title BEGIN '
+    f'INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description) '
+    "VALUES ('delete', old.id, old.name, old.description); "
+    f'INSERT INTO {FTS_TABLE}(rowid, name, description) '
+    'VALUES (new.id, new.name, new.description); END',
+)
+
+FTS_REBUILD = f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+
+
+def is_supported(using=connection):
+    """Полнотекстовый индекс ведётся только в SQLite."""
+    return using.vendor == 'sqlite'
+
+
+def create_search_index(using=connection):
+    if not is_supported(using):
+        return
+    with using.cursor() as cursor:
+        for statement in FTS_CREATE:
+            cursor.execute(statement)
+        cursor.execute(FTS_REBUILD)
+
+
+def rebuild_search_index(using=connection):
+    """Заново строит индекс по таблице произведений."""
+    if not is_supported(using):
+        return
+    with using.cursor() as cursor:
+        cursor.execute(FTS_REBUILD)
+
+
+def build_match_query(words):
+    """Выражение FTS5: каждое слово ищется по префиксу, нужны все слова."""
+    return ' '.join('"{}"*'.format(word) for word in words)
+
+
+def search_titles(queryset, query):
+    """Произведения, подходящие под запрос, по убыванию релевантности."""
+    words = re.findall(r'\w+', query)
+    if not words:
+        return queryset.none()
+    if not is_supported():
+        condition = Q()
+        for word in words:
+            condition &= (Q(name__icontains=word)
+                          | Q(description__icontains=word))
+        return queryset.filter(condition)
+    match = build_match_query(words)
+    return queryset.annotate(search_rank=RawSQL(
+        f'SELECT rank FROM {FTS_TABLE} '
+        f'WHERE {FTS_TABLE} MATCH %s AND rowid = reviews_title.id',
+        (match,)
+    )).filter(
+        id__in=RawSQL(
+            f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s',
+            (match,)
+        )
+    ).order_by('search_rank', 'id')
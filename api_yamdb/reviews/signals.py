@@ -0,0 +1,90 @@
+from django.db.models.signals import (m2m_changed, post_delete, post_save,
+                                      pre_save)
+from django.dispatch import receiver
+
+from reviews.models import Comment, LeaderboardEntry, Review, Title
+from reviews.utils import (record_title_activity, update_leaderboards,
+                           update_score_histogram, update_title_rating)
+
+
+@receiver(pre_save, sender=Review)
+def remember_previous_score(sender, instance, **kwargs):
+    """Запоминает оценку и произведение отзыва до изменения."""
+    instance._previous = None
+    if instance.pk:
+        instance._previous = sender.objects.filter(
+            pk=instance.pk
+        ).values_list('title_id', 'score').first()
+
+
+@receiver(post_save, sender=Review)
+def apply_review_score(sender, instance, created, **kwargs):
+    """Учитывает новую или изменённую оценку в рейтинге."""
+    previous = getattr(instance, '_previous', None)
+    if previous is None:
+        update_title_rating(instance.title_id, instance.score, 1)
+        update_score_histogram(instance.title_id, instance.score, 1)
+        update_leaderboards([instance.title_id])
+        return
+    title_id, score = previous
+    if title_id != instance.title_id:
+        update_title_rating(title_id, -score, -1)
+        update_title_rating(instance.title_id, instance.score, 1)
+    elif score != instance.score:
+        update_title_rating(title_id, instance.score - score, 0)
+    else:
+        return
+    update_score_histogram(title_id, score, -1)
+    update_score_histogram(instance.title_id, instance.score, 1)
+    update_leaderboards({title_id, instance.title_id})
+
+
+@receiver(post_save, sender=Review)
+def count_review_activity(sender, instance, created, **kwargs):
+    """Учитывает новый отзыв в активности произведения."""
+    if created and instance.title_id is not None:
+        record_title_activity(instance.title_id, instance.pub_date)
+
+
+@receiver(post_save, sender=Comment)
+def count_comment_activity(sender, instance, created, **kwargs):
+    """Учитывает новый комментарий в активности произведения."""
+    if not created:
+        return
+    if Comment.reviews.is_cached(instance):
+        title_id = instance.reviews.title_id
+    else:
+        title_id = Review.objects.filter(
+            pk=instance.reviews_id
+        ).values_list('title_id', flat=True).first()
+    if title_id is not None:
+        record_title_activity(title_id, instance.pub_date)
+
+
+@receiver(post_delete, sender=Review)
+def revoke_review_score(sender, instance, **kwargs):
+    """Убирает оценку удалённого отзыва из рейтинга."""
+    update_title_rating(instance.title_id, -instance.score, -1)
+    update_score_histogram(instance.title_id, instance.score, -1)
+    update_leaderboards([instance.title_id])
+
+
+@receiver(post_save, sender=Title)
+def move_title_between_boards(sender, instance, created, **kwargs):
+    """Переносит произведение в рейтинг новой категории."""
+    if not created:
+        update_leaderboards([instance.pk])
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def move_title_between_genre_boards(sender, instance, action, reverse,
+                                    pk_set, **kwargs):
+    """Переносит произведения в рейтинги их новых жанров."""
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        update_leaderboards([instance.pk])
+    elif pk_set:
+        update_leaderboards(pk_set)
+    else:
+        LeaderboardEntry.objects.filter(genre=instance).delete()
@@ -0,0 +1,207 @@
+import math
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db import NotSupportedError, connection, transaction
+from django.db.models import (Count, F, FloatField, OuterRef, Q, Subquery,
+                              Sum)
+from django.db.models.functions import (Abs, Cast, Coalesce, Exp,
+                                        Greatest, Ln, NullIf)
+from django.dispatch import Signal
+
+from api_yamdb.constants import (LEADERBOARD_PRIOR_TIMEOUT,
+                                 LEADERBOARD_PRIOR_WEIGHT,
+                                 MAX_VALUE_VALIDATOR, MIN_VALUE_VALIDATOR,
+                                 SCORES, TRENDING_HALF_LIFE)
+from reviews.models import (LeaderboardEntry, Review, ScoreHistogram, Title,
+                            TitleActivity)
+
+PRIOR_MEAN_KEY = 'leaderboard:prior-mean'
+
+# Отправляется после фиксации массовой вставки произведений, для которой
+# post_save и m2m_changed не срабатывают.
+titles_bulk_created = Signal()
+
+
+def update_title_rating(title_id, score_delta, count_delta):
+    """Сдвигает хранимые сумму оценок, число отзывов и рейтинг.
+
+    Все три поля меняются одним UPDATE, поэтому параллельные
+    запросы не затирают изменения друг друга.
+    """
+    score_sum = F('score_sum') + score_delta
+    review_count = F('review_count') + count_delta
+    Title.objects.filter(pk=title_id).update(
+        score_sum=score_sum,
+        review_count=review_count,
+        rating=(Cast(score_sum, FloatField())
+                / NullIf(review_count, 0)),
+    )
+
+
+def recalculate_ratings(titles):
+    """Пересчитывает рейтинг произведений по их отзывам.
+
+    Используется после массовых операций, минующих сигналы,
+    и для исправления расхождений.
+    """
+    reviews = Review.objects.filter(
+        title=OuterRef('pk')
+    ).order_by().values('title')
+    score_sum = Coalesce(
+        Subquery(reviews.annotate(total=Sum('score')).values('total')), 0
+    )
+    review_count = Coalesce(
+        Subquery(reviews.annotate(total=Count('pk')).values('total')), 0
+    )
+    return titles.update(
+        score_sum=score_sum,
+        review_count=review_count,
+        rating=(Cast(score_sum, FloatField())
+                / NullIf(review_count, 0)),
+    )
+
+
+def update_score_histogram(title_id, score, delta):
+    """Сдвигает счётчик одного балла в распределении оценок."""
+    field = ScoreHistogram.field_name(score)
+    histograms = ScoreHistogram.objects.filter(title_id=title_id)
+    if not histograms.update(**{field: F(field) + delta}) and delta > 0:
+        ScoreHistogram.objects.get_or_create(title_id=title_id)
+        histograms.update(**{field: F(field) + delta})
+
+
+def recalculate_histograms(titles):
+    """Пересобирает распределения оценок произведений по их отзывам."""
+    counts = Review.objects.filter(title__in=titles).order_by().values(
+        'title'
+    ).annotate(**{
+        ScoreHistogram.field_name(score): Count('pk', filter=Q(score=score))
+        for score in SCORES
+    })
+    histograms = [
+        ScoreHistogram(title_id=row.pop('title'), **row) for row in counts
+    ]
+    ScoreHistogram.objects.filter(title__in=titles).delete()
+    ScoreHistogram.objects.bulk_create(histograms)
+
+
+def bayesian_rating(score_sum, review_count, prior_mean):
+    """Средняя оценка, притянутая к средней по всем произведениям.
+
+    Пока отзывов мало, рейтинг близок к prior_mean, поэтому одна
+    оценка 10 не выводит произведение на первое место.
+    """
+    return ((LEADERBOARD_PRIOR_WEIGHT * prior_mean + score_sum)
+            / (LEADERBOARD_PRIOR_WEIGHT + review_count))
+
+
+def compute_prior_mean():
+    totals = Title.objects.aggregate(
+        score_sum=Sum('score_sum'), review_count=Sum('review_count')
+    )
+    if not totals['review_count']:
+        return (MIN_VALUE_VALIDATOR + MAX_VALUE_VALIDATOR) / 2
+    return totals['score_sum'] / totals['review_count']
+
+
+def get_prior_mean():
+    """Средняя оценка по всем произведениям, кешируется на время."""
+    return cache.get_or_set(
+        PRIOR_MEAN_KEY, compute_prior_mean, LEADERBOARD_PRIOR_TIMEOUT
+    )
+
+
+def update_leaderboards(title_ids, prior_mean=None):
+    """Пересчитывает места произведений во всех рейтингах лучших."""
+    if prior_mean is None:
+        prior_mean = get_prior_mean()
+    genres = defaultdict(list)
+    for title_id, genre_id in Title.genre.through.objects.filter(
+        title_id__in=title_ids
+    ).values_list('title_id', 'genre_id'):
+        genres[title_id].append(genre_id)
+    entries = []
+    for title in Title.objects.filter(
+        pk__in=title_ids, review_count__gt=0
+    ).only('score_sum', 'review_count', 'category_id'):
+        score = bayesian_rating(
+            title.score_sum, title.review_count, prior_mean
+        )
+        entries.append(LeaderboardEntry(title=title, score=score))
+        if title.category_id:
+            entries.append(LeaderboardEntry(
+                title=title, category_id=title.category_id, score=score
+            ))
+        entries.extend(
+            LeaderboardEntry(title=title, genre_id=genre_id, score=score)
+            for genre_id in genres[title.pk]
+        )
+    with transaction.atomic():
+        LeaderboardEntry.objects.filter(title_id__in=title_ids).delete()
+        LeaderboardEntry.objects.bulk_create(entries)
+
+
+def activity_time(moment):
+    """Момент времени в единицах затухания счётчиков активности."""
+    return moment.timestamp() * math.log(2) / TRENDING_HALF_LIFE
+
+
+def add_activity(score, time):
+    """Логарифм активности после ещё одного события в момент time."""
+    return max(score, time) + math.log1p(math.exp(-abs(score - time)))
+
+
+def record_title_activity(title_id, moment):
+    """Добавляет событие в счётчик активности произведения.
+
+    Логарифм суммы пересчитывается одним UPDATE, поэтому
+    параллельные события не затирают друг друга.
+    """
+    time = activity_time(moment)
+    score = F('score')
+    activities = TitleActivity.objects.filter(title_id=title_id)
+    update = {
+        'score': Greatest(score, time) + Ln(1 + Exp(-Abs(score - time)))
+    }
+    if not activities.update(**update):
+        _, created = TitleActivity.objects.get_or_create(
+            title_id=title_id, defaults={'score': time}
+        )
+        if not created:
+            activities.update(**update)
+
+
+def bulk_create_titles(titles, genres):
+    """Вставляет произведения и их жанры пачками в одной транзакции.
+
+    genres — списки жанров в том же порядке, что и titles.
+    Сигнал titles_bulk_created отправляется после фиксации транзакции.
+    """
+    returns_pks = connection.features.can_return_rows_from_bulk_insert
+    if not returns_pks and connection.vendor != 'sqlite':
+        raise NotSupportedError(
+            'Массовая вставка произведений требует базы, возвращающей id '
+            'вставленных строк, или SQLite.'
+        )
+    with transaction.atomic():
+        Title.objects.bulk_create(titles)
+        if not returns_pks:
+            # Пишущая транзакция SQLite держит блокировку всей базы:
+            # до её фиксации никто другой не вставляет строки, поэтому
+            # последние id принадлежат этой вставке. В других базах
+            # без RETURNING это не так.
+            pks = Title.objects.order_by('-pk').values_list(
+                'pk', flat=True
+            )[:len(titles)]
+            for title, pk in zip(titles, reversed(list(pks))):
+                title.pk = pk
+        Title.genre.through.objects.bulk_create(
+            Title.genre.through(title_id=title.pk, genre_id=genre.pk)
+            for title, title_genres in zip(titles, genres)
+            for genre in dict.fromkeys(title_genres)
+        )
+        transaction.on_commit(
+            lambda: titles_bulk_created.send(sender=Title, titles=titles)
+        )
+    return titles
@@ -0,0 +1,120 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_reviews, create_single_review
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08RatingAPI:
+
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    HISTOGRAM_URL_TEMPLATE = '/api/v1/titles/{title_id}/rating-histogram/'
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+
+    def get_title(self, client, title_id):
+        response = client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        )
+        assert response.status_code == HTTPStatus.OK
+        return response.json()
+
+    def test_01_rating_follows_review_writes(self, admin_client, client,
+                                             user, user_client,
+                                             moderator, moderator_client):
+        reviews, titles = create_reviews(admin_client, {user: user_client})
+        title_id = titles[0]['id']
+        assert self.get_title(client, title_id)['rating'] == 5, (
+            'Проверьте, что после создания отзыва рейтинг произведения '
+            'пересчитывается.'
+        )
+
+        create_single_review(moderator_client, title_id, 'Отлично', 9)
+        assert self.get_title(client, title_id)['rating'] == 7
+
+        response = user_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[0]['id']
+            ),
+            data={'score': 1}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert self.get_title(client, title_id)['rating'] == 5, (
+            'Проверьте, что после изменения оценки рейтинг произведения '
+            'пересчитывается.'
+        )
+
+        response = user_client.delete(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[0]['id']
+            )
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert self.get_title(client, title_id)['rating'] == 9, (
+            'Проверьте, что после удаления отзыва рейтинг произведения '
+            'пересчитывается.'
+        )
+        assert self.get_title(client, titles[1]['id'])['rating'] is None
+
+    def test_02_reconcile_ratings(self, admin_client, client, user,
+                                  user_client):
+        from reviews.models import ScoreHistogram, Title
+
+        _, titles = create_reviews(admin_client, {user: user_client})
+        Title.objects.update(rating=None, review_count=0, score_sum=0)
+        ScoreHistogram.objects.all().delete()
+
+        call_command('reconcile_ratings', chunk_size=1)
+        title = Title.objects.get(pk=titles[0]['id'])
+        assert title.score_histogram.counts[5] == 1
+        assert (title.rating, title.review_count, title.score_sum) == (
+            5, 1, 5
+        ), (
+            'Проверьте, что команда `reconcile_ratings` восстанавливает '
+            'хранимый рейтинг произведений.'
+        )
+        assert Title.objects.get(pk=titles[1]['id']).rating is None
+
+    def test_03_rating_histogram(self, admin_client, client, user,
+                                 user_client, moderator, moderator_client):
+        reviews, titles = create_reviews(admin_client, {user: user_client})
+        title_id = titles[0]['id']
+        create_single_review(moderator_client, title_id, 'Отлично', 9)
+        create_single_review(admin_client, title_id, 'Хорошо', 8)
+        user_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=reviews[0]['id']
+            ),
+            data={'score': 2}
+        )
+
+        url = self.HISTOGRAM_URL_TEMPLATE.format(title_id=title_id)
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.HISTOGRAM_URL_TEMPLATE}` '
+            'возвращает ответ со статусом 200.'
+        )
+        data = response.json()
+        expected_counts = {str(score): 0 for score in range(1, 11)}
+        expected_counts.update({'2': 1, '8': 1, '9': 1})
+        assert data['counts'] == expected_counts, (
+            f'Проверьте, что ответ на GET-запрос к '
+            f'`{self.HISTOGRAM_URL_TEMPLATE}` содержит количество оценок '
+            'по каждому баллу.'
+        )
+        assert data['count'] == 3
+        assert data['median'] == 8
+        assert data['percentiles'] == {'25': 2, '50': 8, '75': 9, '90': 9}
+
+        response = client.get(
+            self.HISTOGRAM_URL_TEMPLATE.format(title_id=titles[1]['id'])
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['count'] == 0
+        assert response.json()['median'] is None
+
+        response = client.get(self.HISTOGRAM_URL_TEMPLATE.format(title_id=999))
+        assert response.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,145 @@
+from http import HTTPStatus
+
+import pytest
+
+from api.v1.views import CommentViewSet, ReviewViewSet
+from reviews.models import Comment, Review
+from users.models import CustomUser
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09QueryBudget:
+
+    CATEGORIES_URL = '/api/v1/categories/'
+    GENRES_URL = '/api/v1/genres/'
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def create_many_titles(self, admin_client, count):
+        titles, categories, genres = create_titles(admin_client)
+        for idx in range(count):
+            admin_client.post(self.TITLES_URL, data={
+                'name': f'Произведение {idx}',
+                'year': 2000 + idx,
+                'genre': [genre['slug'] for genre in genres],
+                'category': categories[idx % 2]['slug'],
+            })
+        return titles
+
+    def create_many_authors(self, count):
+        return [
+            CustomUser.objects.create_user(
+                username=f'author{idx}', email=f'author{idx}@yamdb.fake'
+            )
+            for idx in range(count)
+        ]
+
+    def check_query_budget(self, client, url, budget,
+                           django_assert_num_queries):
+        with django_assert_num_queries(budget) as context:
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{url}` возвращает ответ со '
+            'статусом 200.'
+        )
+        response.captured_queries = context.captured_queries
+        return response
+
+    def check_author_list_budget(self, client, url, viewset, budget,
+                                 django_assert_num_queries, monkeypatch):
+        response = self.check_query_budget(
+            client, url, budget + 1, django_assert_num_queries
+        )
+        assert len(response.json()['results']) > 1, (
+            'Количество запросов к базе данных при GET-запросе к '
+            f'`{url}` не должно зависеть от размера страницы.'
+        )
+        monkeypatch.setattr(viewset, 'pagination_class', None)
+        response = self.check_query_budget(
+            client, url, budget, django_assert_num_queries
+        )
+        assert len(response.json()) > 1
+        assert all(item['author'] for item in response.json())
+        assert not [
+            query for query in response.captured_queries
+            if '"users_customuser"."email"' in query['sql']
+        ], (
+            f'Проверьте, что при GET-запросе к `{url}` из таблицы '
+            'пользователей загружается только имя автора.'
+        )
+
+    def test_01_catalog_list_budget(self, admin_client, client,
+                                    django_assert_num_queries):
+        self.create_many_titles(admin_client, 5)
+        self.check_query_budget(
+            client, self.CATEGORIES_URL, 2, django_assert_num_queries
+        )
+        self.check_query_budget(
+            client, self.GENRES_URL, 2, django_assert_num_queries
+        )
+
+    def test_02_title_list_budget(self, admin_client, client,
+                                  django_assert_num_queries):
+        self.create_many_titles(admin_client, 5)
+        response = self.check_query_budget(
+            client, self.TITLES_URL, 3, django_assert_num_queries
+        )
+        assert len(response.json()['results']) > 1, (
+            'Количество запросов к базе данных при GET-запросе к '
+            f'`{self.TITLES_URL}` не должно зависеть от размера страницы.'
+        )
+
+    def test_03_title_detail_budget(self, admin_client, client,
+                                    django_assert_num_queries):
+        titles = self.create_many_titles(admin_client, 1)
+        self.check_query_budget(
+            client,
+            self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id']),
+            2,
+            django_assert_num_queries
+        )
+
+    def test_04_review_list_budget(self, admin_client, client,
+                                   django_assert_num_queries, monkeypatch):
+        titles = self.create_many_titles(admin_client, 0)
+        title_id = titles[0]['id']
+        Review.objects.bulk_create(
+            Review(author=author, title_id=title_id, text='Отзыв', score=5)
+            for author in self.create_many_authors(7)
+        )
+        self.check_author_list_budget(
+            client,
+            self.REVIEWS_URL_TEMPLATE.format(title_id=title_id),
+            ReviewViewSet,
+            2,
+            django_assert_num_queries,
+            monkeypatch
+        )
+
+    def test_05_comment_list_budget(self, admin_client, client,
+                                    django_assert_num_queries, monkeypatch):
+        titles = self.create_many_titles(admin_client, 0)
+        title_id = titles[0]['id']
+        authors = self.create_many_authors(7)
+        review = Review.objects.create(
+            author=authors[0], title_id=title_id, text='Отзыв', score=5
+        )
+        Comment.objects.bulk_create(
+            Comment(author=author, reviews=review, text='Комментарий')
+            for author in authors
+        )
+        self.check_author_list_budget(
+            client,
+            self.COMMENTS_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review.id
+            ),
+            CommentViewSet,
+            2,
+            django_assert_num_queries,
+            monkeypatch
+        )
@@ -0,0 +1,97 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10TitleCursorPagination:
+
+    TITLES_URL = '/api/v1/titles/'
+    CURSOR_URL = '/api/v1/titles/?pagination=cursor'
+
+    def create_many_titles(self, admin_client):
+        create_titles(admin_client)
+        for idx in range(9):
+            admin_client.post(self.TITLES_URL, data={
+                'name': f'Произведение {idx % 3}',
+                'year': 2000 + idx // 3,
+                'genre': ['comedy'],
+                'category': 'books',
+            })
+
+    def test_01_cursor_pages_follow_title_ordering(self, admin_client,
+                                                   client):
+        self.create_many_titles(admin_client)
+        expected = []
+        url = self.TITLES_URL
+        while url:
+            data = client.get(url).json()
+            expected.extend(title['id'] for title in data['results'])
+            url = data['next']
+
+        pages = []
+        url = self.CURSOR_URL
+        while url:
+            response = client.get(url)
+            assert response.status_code == HTTPStatus.OK, (
+                'Проверьте, что GET-запрос к `/api/v1/titles/` с пагинацией '
+                'по курсору возвращает ответ со статусом 200.'
+            )
+            data = response.json()
+            assert 'count' not in data, (
+                'Пагинация по курсору не должна подсчитывать количество '
+                'произведений.'
+            )
+            pages.append([title['id'] for title in data['results']])
+            url = data['next']
+        assert sum(pages, []) == expected, (
+            'Проверьте, что пагинация по курсору возвращает произведения '
+            'в том же порядке, что и постраничная пагинация.'
+        )
+
+        data = client.get(self.CURSOR_URL).json()
+        data = client.get(data['next']).json()
+        assert data['previous'], (
+            'Проверьте, что вторая страница содержит ссылку на предыдущую.'
+        )
+        data = client.get(data['previous']).json()
+        assert [title['id'] for title in data['results']] == pages[0]
+        assert data['previous'] is None
+
+    def test_02_page_number_pagination_kept(self, admin_client, client):
+        self.create_many_titles(admin_client)
+        data = client.get(self.TITLES_URL).json()
+        assert data['count'] == 11, (
+            'Постраничная пагинация `/api/v1/titles/` должна оставаться '
+            'доступной по умолчанию.'
+        )
+
+    def test_03_invalid_cursor(self, client):
+        response = client.get(f'{self.TITLES_URL}?cursor=broken')
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_04_cursor_page_reads_index_in_order(self, admin_client,
+                                                 client):
+        self.create_many_titles(admin_client)
+        data = client.get(self.CURSOR_URL).json()
+        with CaptureQueriesContext(connection) as context:
+            client.get(data['next'])
+            client.get(client.get(data['next']).json()['previous'])
+        pages = [
+            query['sql'] for query in context.captured_queries
+            if 'FROM "reviews_title"' in query['sql']
+            and 'ORDER BY' in query['sql']
+        ]
+        assert pages
+        with connection.cursor() as cursor:
+            for sql in pages:
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+                plan = ' '.join(str(row[-1]) for row in cursor.fetchall())
+                assert 'TEMP B-TREE' not in plan, (
+                    'Проверьте, что страница после курсора читается '
+                    f'по индексу без сортировки: {plan}'
+                )
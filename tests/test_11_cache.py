@@ -0,0 +1,113 @@
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+import pytest
+from django.db import transaction
+
+from api.v1.cache import bump_generation, get_cache, get_generations
+from reviews.models import Genre
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11ResponseCache:
+
+    CATEGORIES_URL = '/api/v1/categories/'
+    GENRES_URL = '/api/v1/genres/'
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    def test_01_repeated_reads_are_cached(self, admin_client, client,
+                                          django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        urls = (
+            self.CATEGORIES_URL,
+            self.GENRES_URL,
+            self.TITLES_URL,
+            f'{self.TITLES_URL}?year=1984',
+            self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id']),
+        )
+        for url in urls:
+            expected = client.get(url).json()
+            with django_assert_num_queries(0):
+                response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            assert response.json() == expected, (
+                f'Проверьте, что повторный GET-запрос к `{url}` '
+                'возвращает закешированный ответ без обращения к базе данных.'
+            )
+
+    def test_02_writes_invalidate_cache(self, admin_client, client,
+                                        user_client):
+        titles, _, _ = create_titles(admin_client)
+        detail_url = self.TITLES_DETAIL_URL_TEMPLATE.format(
+            title_id=titles[0]['id']
+        )
+        client.get(self.CATEGORIES_URL)
+        client.get(self.GENRES_URL)
+        client.get(detail_url)
+
+        admin_client.post(
+            self.CATEGORIES_URL, data={'name': 'Музыка', 'slug': 'music'}
+        )
+        assert client.get(self.CATEGORIES_URL).json()['count'] == 3, (
+            'Проверьте, что создание категории сбрасывает кеш '
+            f'`{self.CATEGORIES_URL}`.'
+        )
+        admin_client.delete(f'{self.GENRES_URL}drama/')
+        assert client.get(self.GENRES_URL).json()['count'] == 2, (
+            'Проверьте, что удаление жанра сбрасывает кеш '
+            f'`{self.GENRES_URL}`.'
+        )
+
+        admin_client.patch(detail_url, data={'genre': ['comedy']})
+        genres = [genre['slug'] for genre in client.get(detail_url).json()[
+            'genre'
+        ]]
+        assert genres == ['comedy'], (
+            'Проверьте, что изменение жанров произведения сбрасывает кеш '
+            f'`{self.TITLES_DETAIL_URL_TEMPLATE}`.'
+        )
+
+        create_single_review(user_client, titles[0]['id'], 'Неплохо', 7)
+        assert client.get(detail_url).json()['rating'] == 7, (
+            'Проверьте, что новый отзыв сбрасывает кеш '
+            f'`{self.TITLES_DETAIL_URL_TEMPLATE}`.'
+        )
+
+    def test_03_generations_move_after_commit(self, admin_client, client):
+        create_titles(admin_client)
+        client.get('/api/v1/autocomplete/', {'q': 'три'})
+        before = get_generations([Genre])
+        with transaction.atomic():
+            Genre.objects.create(name='Триллер', slug='thriller')
+            assert get_generations([Genre]) == before, (
+                'Проверьте, что поколение модели сдвигается только после '
+                'фиксации транзакции.'
+            )
+        assert get_generations([Genre]) != before
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                Genre.objects.create(name='Трагедия', slug='tragedy')
+                raise RuntimeError
+        response = client.get('/api/v1/autocomplete/', {'q': 'тра'})
+        assert response.json()['results'] == [], (
+            'Проверьте, что изменения из откаченной транзакции не попадают '
+            'в индексы в памяти.'
+        )
+
+    def test_04_concurrent_bumps_are_distinct(self, monkeypatch):
+        (before,) = get_generations([Genre])
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            generations = list(executor.map(
+                lambda _: bump_generation(Genre), range(40)
+            ))
+        assert sorted(generations) == list(range(before + 1, before + 41)), (
+            'Проверьте, что одновременные изменения модели получают '
+            'разные номера поколения.'
+        )
+        monkeypatch.setattr(get_cache(), 'default_timeout', -1)
+        bump_generation(Genre)
+        assert get_generations([Genre]) == (before + 41,), (
+            'Проверьте, что incr не меняет срок хранения поколения.'
+        )
@@ -0,0 +1,82 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_comments, create_single_review
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12ConditionalGet:
+
+    TITLES_URL = '/api/v1/titles/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def test_01_if_none_match(self, admin_client, client, user, user_client,
+                              django_assert_num_queries):
+        _, reviews, titles = create_comments(admin_client, {user: user_client})
+        urls = (
+            self.TITLES_URL,
+            f'{self.TITLES_URL}{titles[0]["id"]}/',
+            self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id']),
+            self.COMMENTS_URL_TEMPLATE.format(
+                title_id=titles[0]['id'], review_id=reviews[0]['id']
+            ),
+        )
+        for url in urls:
+            response = client.get(url)
+            etag = response.get('ETag')
+            assert etag and not etag.startswith('W/'), (
+                f'Проверьте, что ответ на GET-запрос к `{url}` содержит '
+                'сильный заголовок `ETag`.'
+            )
+            assert response.get('Last-Modified'), (
+                f'Проверьте, что ответ на GET-запрос к `{url}` содержит '
+                'заголовок `Last-Modified`.'
+            )
+            with django_assert_num_queries(0):
+                response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+                f'Проверьте, что GET-запрос к `{url}` с актуальным '
+                '`If-None-Match` возвращает ответ со статусом 304 без '
+                'обращения к базе данных.'
+            )
+            with django_assert_num_queries(0):
+                response = client.get(
+                    url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified']
+                )
+            assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_02_etag_changes_after_write(self, admin_client, client, user,
+                                         user_client, moderator_client):
+        _, reviews, titles = create_comments(admin_client, {user: user_client})
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        etag = client.get(url)['ETag']
+        create_single_review(moderator_client, titles[0]['id'], 'Хорошо', 8)
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что после создания отзыва GET-запрос к `{url}` '
+            'со старым `If-None-Match` возвращает ответ со статусом 200.'
+        )
+        assert response['ETag'] != etag
+        assert response.json()['count'] == 2
+
+    def test_03_if_none_match_any(self, admin_client, client, user,
+                                  user_client):
+        _, _, titles = create_comments(admin_client, {user: user_client})
+        url = f'{self.TITLES_URL}{titles[0]["id"]}/'
+        response = client.get(url, HTTP_IF_NONE_MATCH='*')
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            'Проверьте, что `If-None-Match: *` для существующего объекта '
+            'возвращает ответ со статусом 304.'
+        )
+        response = client.get(
+            f'{self.TITLES_URL}{titles[-1]["id"] + 100}/',
+            HTTP_IF_NONE_MATCH='*'
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что `If-None-Match: *` для несуществующего объекта '
+            'возвращает ответ со статусом 404, а не 304.'
+        )
@@ -0,0 +1,52 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13TitleSearch:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def search(self, client, query):
+        response = client.get(self.TITLES_URL, {'q': query})
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}?q=` '
+            'возвращает ответ со статусом 200.'
+        )
+        return [title['name'] for title in response.json()['results']]
+
+    def test_01_search_is_case_insensitive_for_cyrillic(self, admin_client,
+                                                        client):
+        create_titles(admin_client)
+        assert self.search(client, 'КРЕПКИЙ') == ['Крепкий орешек'], (
+            'Проверьте, что поиск по `q` не зависит от регистра '
+            'кириллических букв.'
+        )
+        assert self.search(client, 'терм') == ['Терминатор'], (
+            'Проверьте, что поиск по `q` находит слова по префиксу.'
+        )
+        assert self.search(client, 'yippie') == ['Крепкий орешек'], (
+            'Проверьте, что поиск по `q` учитывает описание произведения.'
+        )
+        assert self.search(client, 'орешек терминатор') == []
+
+    def test_02_index_follows_title_changes(self, admin_client, client):
+        titles, _, _ = create_titles(admin_client)
+        admin_client.patch(
+            f'{self.TITLES_URL}{titles[0]["id"]}/',
+            data={'name': 'Чужие'}
+        )
+        assert self.search(client, 'чужие') == ['Чужие']
+        assert self.search(client, 'терминатор') == []
+
+        admin_client.delete(f'{self.TITLES_URL}{titles[0]["id"]}/')
+        assert self.search(client, 'чужие') == []
+
+    def test_03_rebuild_command(self, admin_client, client):
+        create_titles(admin_client)
+        call_command('rebuild_title_search')
+        assert self.search(client, 'орешек') == ['Крепкий орешек']
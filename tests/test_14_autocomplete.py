@@ -0,0 +1,81 @@
+from http import HTTPStatus
+
+import pytest
+
+from api.v1.cache import bump_generation
+from reviews.models import Genre
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14Autocomplete:
+
+    AUTOCOMPLETE_URL = '/api/v1/autocomplete/'
+
+    def suggest(self, client, query, **params):
+        response = client.get(self.AUTOCOMPLETE_URL, {'q': query, **params})
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.AUTOCOMPLETE_URL}` '
+            'возвращает ответ со статусом 200.'
+        )
+        return response.json()['results']
+
+    def test_01_prefix_matches(self, admin_client, client,
+                               django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        assert self.suggest(client, 'кре') == [
+            {'type': 'title', 'id': titles[1]['id'],
+             'name': 'Крепкий орешек'},
+        ], (
+            f'Проверьте, что `{self.AUTOCOMPLETE_URL}` подсказывает '
+            'произведения по началу названия без учёта регистра.'
+        )
+        assert self.suggest(client, 'ОРЕ')[0]['name'] == 'Крепкий орешек', (
+            f'Проверьте, что `{self.AUTOCOMPLETE_URL}` подсказывает '
+            'по началу любого слова в названии.'
+        )
+        assert {'type': 'genre', 'slug': 'comedy', 'name': 'Комедия'} in (
+            self.suggest(client, 'ко')
+        )
+        assert {'type': 'category', 'slug': 'books', 'name': 'Книги'} in (
+            self.suggest(client, 'кни')
+        )
+        assert len(self.suggest(client, 'к', limit=1)) == 1
+        assert self.suggest(client, '') == []
+
+        with django_assert_num_queries(0):
+            self.suggest(client, 'тер')
+
+    def test_02_index_follows_catalog_changes(self, admin_client, client):
+        titles, _, _ = create_titles(admin_client)
+        self.suggest(client, 'тер')
+        admin_client.post(
+            '/api/v1/genres/', data={'name': 'Триллер', 'slug': 'thriller'}
+        )
+        assert self.suggest(client, 'три') == [
+            {'type': 'genre', 'slug': 'thriller', 'name': 'Триллер'},
+        ], (
+            'Проверьте, что новые жанры сразу попадают в подсказки.'
+        )
+        admin_client.delete(f'/api/v1/titles/{titles[0]["id"]}/')
+        assert self.suggest(client, 'тер') == [], (
+            'Проверьте, что удалённые произведения пропадают из подсказок.'
+        )
+
+    def test_03_index_reloads_after_other_process_changes(self, admin_client,
+                                                          client):
+        create_titles(admin_client)
+        self.suggest(client, 'ко')
+        # Так выглядит изменение из другого процесса: сигналы этого
+        # процесса о нём не знают, меняется только поколение.
+        Genre.objects.filter(slug='comedy').update(name='Мюзикл')
+        bump_generation(Genre)
+        admin_client.post(
+            '/api/v1/genres/', data={'name': 'Триллер', 'slug': 'thriller'}
+        )
+        assert self.suggest(client, 'мю') == [
+            {'type': 'genre', 'slug': 'comedy', 'name': 'Мюзикл'},
+        ], (
+            'Проверьте, что индекс перезагружается, если между его '
+            'изменениями каталог менялся в другом процессе.'
+        )
@@ -0,0 +1,76 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test15TopTitles:
+
+    TITLES_URL = '/api/v1/titles/'
+    TOP_URL = '/api/v1/titles/top/'
+
+    def get_top(self, client, **params):
+        response = client.get(self.TOP_URL, params)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TOP_URL}` возвращает ответ '
+            'со статусом 200.'
+        )
+        return [title['name'] for title in response.json()]
+
+    def create_rated_titles(self, admin_client, clients):
+        titles, _, _ = create_titles(admin_client)
+        response = admin_client.post(self.TITLES_URL, data={
+            'name': 'Один в поле',
+            'year': 2001,
+            'genre': ['comedy'],
+            'category': 'films',
+        })
+        single_id = response.json()['id']
+        create_single_review(clients[0], single_id, 'Шедевр', 10)
+        for client in clients:
+            create_single_review(client, titles[0]['id'], 'Отлично', 9)
+        for client in clients[:2]:
+            create_single_review(client, titles[1]['id'], 'Плохо', 1)
+        call_command('rebuild_leaderboards')
+        return titles
+
+    def test_01_bayesian_ranking(self, admin_client, client, user_client,
+                                 moderator_client):
+        self.create_rated_titles(
+            admin_client, (admin_client, user_client, moderator_client)
+        )
+        assert self.get_top(client) == [
+            'Терминатор', 'Один в поле', 'Крепкий орешек'
+        ], (
+            f'Проверьте, что `{self.TOP_URL}` ранжирует произведения по '
+            'взвешенному рейтингу и одна оценка 10 не выводит произведение '
+            'на первое место.'
+        )
+        assert self.get_top(client, category='books') == ['Крепкий орешек']
+        assert self.get_top(client, genre='comedy') == [
+            'Терминатор', 'Один в поле'
+        ]
+        assert self.get_top(client, genre='comedy', category='films',
+                            limit=1) == ['Терминатор']
+        assert self.get_top(client, genre='unknown') == []
+
+    def test_02_boards_follow_changes(self, admin_client, client,
+                                      user_client, moderator_client):
+        titles = self.create_rated_titles(
+            admin_client, (admin_client, user_client, moderator_client)
+        )
+        admin_client.patch(
+            f'{self.TITLES_URL}{titles[1]["id"]}/',
+            data={'genre': ['comedy'], 'category': 'films'}
+        )
+        assert 'Крепкий орешек' in self.get_top(client, genre='comedy'), (
+            'Проверьте, что смена жанров произведения переносит его '
+            'в рейтинг нового жанра.'
+        )
+        assert self.get_top(client, category='books') == []
+
+        admin_client.delete(f'{self.TITLES_URL}{titles[0]["id"]}/')
+        assert 'Терминатор' not in self.get_top(client)
@@ -0,0 +1,80 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16TitleOrdering:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def get_names(self, client, ordering):
+        response = client.get(self.TITLES_URL, {'ordering': ordering})
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}?ordering=` '
+            'возвращает ответ со статусом 200.'
+        )
+        return [title['name'] for title in response.json()['results']]
+
+    def test_01_ordering(self, admin_client, client, user_client,
+                         moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        admin_client.post(self.TITLES_URL, data={
+            'name': 'Без отзывов',
+            'year': 2010,
+            'genre': ['comedy'],
+            'category': 'films',
+        })
+        create_single_review(user_client, titles[0]['id'], 'Хорошо', 8)
+        create_single_review(user_client, titles[1]['id'], 'Отлично', 10)
+        create_single_review(moderator_client, titles[1]['id'], 'Так', 4)
+
+        assert self.get_names(client, '-rating')[:2] == [
+            'Терминатор', 'Крепкий орешек'
+        ], (
+            'Проверьте, что `ordering=-rating` сортирует произведения '
+            'по убыванию рейтинга.'
+        )
+        assert self.get_names(client, 'year') == [
+            'Терминатор', 'Крепкий орешек', 'Без отзывов'
+        ]
+        assert self.get_names(client, '-review_count')[0] == (
+            'Крепкий орешек'
+        )
+        assert self.get_names(client, 'name') == [
+            'Без отзывов', 'Крепкий орешек', 'Терминатор'
+        ]
+        assert self.get_names(client, 'description') == [
+            'Без отзывов', 'Крепкий орешек', 'Терминатор'
+        ], (
+            'Сортировка по полям, которых нет в `ordering_fields`, '
+            'должна игнорироваться.'
+        )
+
+    @pytest.mark.parametrize('field', ('rating', 'year', 'review_count',
+                                       'name'))
+    @pytest.mark.parametrize('direction', ('', '-'), ids=('asc', 'desc'))
+    def test_02_ordering_uses_index(self, admin_client, client, field,
+                                    direction):
+        create_titles(admin_client)
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(
+                self.TITLES_URL, {'ordering': f'{direction}{field}'}
+            )
+        assert response.status_code == HTTPStatus.OK
+        (sql,) = [
+            query['sql'] for query in context.captured_queries
+            if 'FROM "reviews_title"' in query['sql']
+            and 'ORDER BY' in query['sql']
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            plan = ' '.join(str(row[-1]) for row in cursor.fetchall())
+        assert 'TEMP B-TREE' not in plan, (
+            f'Проверьте, что для сортировки по `{field}` есть индекс: '
+            f'{plan}'
+        )
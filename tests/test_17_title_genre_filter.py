@@ -0,0 +1,87 @@
+from http import HTTPStatus
+from types import SimpleNamespace
+
+import pytest
+
+from api.v1 import indexes
+from reviews.models import Genre, Title
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17TitleGenreFilter:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def get_names(self, client, **params):
+        response = client.get(self.TITLES_URL, params)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}` с фильтрами '
+            'возвращает ответ со статусом 200.'
+        )
+        return sorted(title['name'] for title in response.json()['results'])
+
+    def create_catalog(self, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        admin_client.post(self.TITLES_URL, data={
+            'name': 'Ужасно смешно',
+            'year': 2005,
+            'genre': ['horror', 'comedy', 'drama'],
+            'category': 'films',
+        })
+        return titles
+
+    def test_01_genre_modes(self, admin_client, client):
+        self.create_catalog(admin_client)
+        assert self.get_names(client, genre='comedy,drama') == [
+            'Крепкий орешек', 'Терминатор', 'Ужасно смешно'
+        ], (
+            'Проверьте, что `genre=a,b` по умолчанию возвращает произведения '
+            'с любым из жанров.'
+        )
+        assert self.get_names(
+            client, genre='comedy,drama', genre_mode='all'
+        ) == ['Ужасно смешно'], (
+            'Проверьте, что `genre_mode=all` возвращает произведения '
+            'со всеми перечисленными жанрами.'
+        )
+        assert self.get_names(
+            client, genre='horror,comedy', genre_mode='all', category='films'
+        ) == ['Терминатор', 'Ужасно смешно']
+        assert self.get_names(client, genre='unknown') == []
+        assert self.get_names(client, category='films,books') == [
+            'Крепкий орешек', 'Терминатор', 'Ужасно смешно'
+        ]
+        response = client.get(self.TITLES_URL, {'genre_mode': 'some'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_02_index_follows_changes(self, admin_client, client):
+        titles = self.create_catalog(admin_client)
+        self.get_names(client, genre='drama')
+        admin_client.patch(
+            f'{self.TITLES_URL}{titles[0]["id"]}/', data={'genre': ['drama']}
+        )
+        assert self.get_names(client, genre='drama') == [
+            'Крепкий орешек', 'Терминатор', 'Ужасно смешно'
+        ], (
+            'Проверьте, что смена жанров произведения сразу учитывается '
+            'в фильтре по жанрам.'
+        )
+        assert self.get_names(client, genre='comedy') == ['Ужасно смешно']
+        admin_client.delete('/api/v1/genres/drama/')
+        assert self.get_names(client, genre='drama') == []
+
+    def test_03_genre_linked_during_load(self, admin_client, monkeypatch):
+        create_titles(admin_client)
+        slugs = list(Genre.objects.values_list('pk', 'slug'))
+        genre = Genre.objects.create(name='Триллер', slug='thriller')
+        Title.objects.first().genre.add(genre)
+        monkeypatch.setattr(indexes, 'Genre', SimpleNamespace(
+            objects=SimpleNamespace(values_list=lambda *fields: slugs)
+        ))
+        index = indexes.GenreIndex()
+        index.load()
+        assert index._titles[genre.pk], (
+            'Проверьте, что жанр, связанный с произведением во время '
+            'загрузки индекса, не ломает загрузку.'
+        )
@@ -0,0 +1,48 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18TitleYearFilter:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def get_years(self, client, **params):
+        response = client.get(self.TITLES_URL, params)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}` с фильтром '
+            'по годам возвращает ответ со статусом 200.'
+        )
+        return sorted(title['year'] for title in response.json()['results'])
+
+    def test_01_year_filters(self, admin_client, client):
+        create_titles(admin_client)
+        for year in (1979, 1990, 1999):
+            admin_client.post(self.TITLES_URL, data={
+                'name': f'Фильм {year} года',
+                'year': year,
+                'genre': ['drama'],
+                'category': 'films',
+            })
+        assert self.get_years(client, year_min=1984, year_max=1990) == [
+            1984, 1988, 1990
+        ], (
+            'Проверьте, что `year_min` и `year_max` ограничивают годы '
+            'выпуска включительно.'
+        )
+        assert self.get_years(client, decade=1980) == [1984, 1988], (
+            'Проверьте, что `decade=1980` возвращает произведения '
+            '1980–1989 годов.'
+        )
+        assert self.get_years(client, decade=1995) == [1990, 1999]
+        assert self.get_years(
+            client, category='films', year_min=1980
+        ) == [1984, 1990, 1999]
+        assert self.get_years(client, category='books', decade=1980) == [
+            1988
+        ]
+        response = client.get(self.TITLES_URL, {'year_min': 'давно'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
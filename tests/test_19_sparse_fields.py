@@ -0,0 +1,64 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_reviews, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test19SparseFields:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+
+    def test_01_title_list_fields(self, admin_client, client,
+                                  django_assert_num_queries):
+        create_titles(admin_client)
+        with django_assert_num_queries(2) as context:
+            response = client.get(
+                self.TITLES_URL, {'fields': 'id,name,rating'}
+            )
+        assert response.status_code == HTTPStatus.OK
+        for title in response.json()['results']:
+            assert set(title) == {'id', 'name', 'rating'}, (
+                'Проверьте, что параметр `fields` оставляет в ответе '
+                'только перечисленные поля произведения.'
+            )
+        title_query = context.captured_queries[-1]['sql']
+        assert 'description' not in title_query, (
+            'Проверьте, что незапрошенное описание произведения '
+            'не читается из базы данных.'
+        )
+        assert 'reviews_category' not in title_query, (
+            'Проверьте, что незапрошенная категория не подгружается '
+            'вместе с произведением.'
+        )
+
+    def test_02_title_nested_fields(self, admin_client, client):
+        titles, _, _ = create_titles(admin_client)
+        url = self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        response = client.get(url, {'fields': 'name,genre,category'})
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert set(data) == {'name', 'genre', 'category'}
+        assert data['category'] == {'name': 'Фильм', 'slug': 'films'}, (
+            'Проверьте, что запрошенные вложенные поля отдаются целиком.'
+        )
+        assert len(data['genre']) == 2
+        response = client.get(url)
+        assert 'description' in response.json(), (
+            'Проверьте, что без параметра `fields` произведение '
+            'отдаётся со всеми полями.'
+        )
+
+    def test_03_review_fields(self, admin_client, client, user,
+                              user_client):
+        _, titles = create_reviews(admin_client, {user: user_client})
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        response = client.get(url, {'fields': 'id,score'})
+        assert response.status_code == HTTPStatus.OK
+        for review in response.json()['results']:
+            assert set(review) == {'id', 'score'}, (
+                'Проверьте, что параметр `fields` работает и для отзывов.'
+            )
@@ -0,0 +1,77 @@
+from http import HTTPStatus
+
+import pytest
+
+from api_yamdb.constants import COMMENTS_PREVIEW_SIZE
+from tests.utils import create_comments, create_single_comment
+
+
+@pytest.mark.django_db(transaction=True)
+class Test20TitlePage:
+
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    def create_page(self, admin_client, user, user_client, moderator,
+                    moderator_client):
+        comments, reviews, titles = create_comments(
+            admin_client, {user: user_client, moderator: moderator_client}
+        )
+        for idx in range(COMMENTS_PREVIEW_SIZE):
+            create_single_comment(
+                user_client, titles[0]['id'], reviews[0]['id'],
+                f'extra comment {idx}'
+            )
+        return reviews, titles
+
+    def test_01_title_page_previews(self, admin_client, client, user,
+                                    user_client, moderator, moderator_client,
+                                    django_assert_num_queries):
+        reviews, titles = self.create_page(
+            admin_client, user, user_client, moderator, moderator_client
+        )
+        url = self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        with django_assert_num_queries(4):
+            response = client.get(
+                url, {'include': 'reviews_preview,comments_preview'}
+            )
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{url}` с параметром `include` '
+            'возвращает ответ со статусом 200.'
+        )
+        data = response.json()
+        assert data['name'] == titles[0]['name']
+        previews = {
+            review['id']: review for review in data['reviews_preview']
+        }
+        assert set(previews) == {review['id'] for review in reviews}, (
+            'Проверьте, что `reviews_preview` содержит отзывы '
+            'произведения.'
+        )
+        first = previews[reviews[0]['id']]
+        assert first['author'] == reviews[0]['author']
+        assert len(first['comments_preview']) == COMMENTS_PREVIEW_SIZE, (
+            'Проверьте, что `comments_preview` ограничен первыми '
+            'комментариями отзыва.'
+        )
+        assert {
+            comment['author'] for comment in first['comments_preview']
+        } <= {user.username, moderator.username}
+        assert previews[reviews[1]['id']]['comments_preview'] == []
+
+    def test_02_title_page_reviews_only(self, admin_client, client, user,
+                                        user_client, moderator,
+                                        moderator_client):
+        _, titles = self.create_page(
+            admin_client, user, user_client, moderator, moderator_client
+        )
+        url = self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        data = client.get(url, {'include': 'reviews_preview'}).json()
+        assert len(data['reviews_preview']) == 2
+        assert 'comments_preview' not in data['reviews_preview'][0], (
+            'Проверьте, что комментарии не выводятся, если их превью '
+            'не запрошено.'
+        )
+        assert 'reviews_preview' not in client.get(url).json(), (
+            'Проверьте, что без параметра `include` произведение '
+            'выводится без превью.'
+        )
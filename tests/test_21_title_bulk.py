@@ -0,0 +1,146 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from api.v1.cache import get_generations
+from reviews.models import Category, Genre, Title
+from reviews.utils import bulk_create_titles, titles_bulk_created
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test21TitleBulk:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_BULK_URL = '/api/v1/titles/bulk/'
+    AUTOCOMPLETE_URL = '/api/v1/autocomplete/'
+
+    def make_titles(self, count, prefix):
+        return [
+            {
+                'name': f'{prefix} {idx}',
+                'year': 2000 + idx,
+                'description': f'Описание {idx}',
+                'genre': ['horror', 'drama'] if idx % 2 else ['comedy'],
+                'category': 'films' if idx % 2 else 'books',
+            }
+            for idx in range(count)
+        ]
+
+    def post_bulk(self, client, data):
+        with CaptureQueriesContext(connection) as context:
+            response = client.post(
+                self.TITLES_BULK_URL, data=data, format='json'
+            )
+        return response, len(context.captured_queries)
+
+    def test_01_bulk_create(self, admin_client, client):
+        create_titles(admin_client)
+        client.get(self.AUTOCOMPLETE_URL, {'q': 'пачка'})
+        data = self.make_titles(3, 'Пачка')
+        response, _ = self.post_bulk(admin_client, data)
+        assert response.status_code == HTTPStatus.CREATED, (
+            f'Проверьте, что POST-запрос администратора к '
+            f'`{self.TITLES_BULK_URL}` создаёт произведения и возвращает '
+            'ответ со статусом 201.'
+        )
+        created = response.json()
+        assert [title['name'] for title in created] == [
+            title['name'] for title in data
+        ]
+        for title in created:
+            detail = client.get(f'{self.TITLES_URL}{title["id"]}/').json()
+            assert detail['name'] == title['name'], (
+                'Проверьте, что в ответе указаны id созданных произведений.'
+            )
+            assert sorted(
+                genre['slug'] for genre in detail['genre']
+            ) == sorted(title['genre'])
+            assert detail['category']['slug'] == title['category']
+        response = client.get(self.TITLES_URL)
+        assert response.json()['count'] == 5, (
+            'Проверьте, что список произведений обновляется после '
+            'массового создания.'
+        )
+        response = client.get(self.AUTOCOMPLETE_URL, {'q': 'пачка'})
+        assert len(response.json()['results']) == 3, (
+            'Проверьте, что подсказки видят массово созданные произведения.'
+        )
+
+    def test_02_bulk_query_count(self, admin_client):
+        create_titles(admin_client)
+        response, few = self.post_bulk(
+            admin_client, self.make_titles(2, 'Мало')
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        response, many = self.post_bulk(
+            admin_client, self.make_titles(40, 'Много')
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert few == many, (
+            'Проверьте, что число запросов к базе данных при массовом '
+            'создании не зависит от количества произведений.'
+        )
+
+    def test_03_bulk_validation(self, admin_client, user_client):
+        create_titles(admin_client)
+        data = self.make_titles(2, 'Ошибка')
+        data[1]['category'] = 'unknown'
+        data[1]['genre'] = ['horror', 'missing']
+        response, _ = self.post_bulk(admin_client, data)
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что несуществующие слаги категорий и жанров '
+            'приводят к ответу со статусом 400.'
+        )
+        errors = response.json()
+        assert errors[0] == {}
+        assert set(errors[1]) == {'category', 'genre'}
+        assert admin_client.get(self.TITLES_URL).json()['count'] == 2, (
+            'Проверьте, что при ошибке не создаётся ни одно произведение.'
+        )
+        response, _ = self.post_bulk(user_client, self.make_titles(1, 'Нет'))
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+    def test_04_bulk_signal_after_commit(self, admin_client):
+        create_titles(admin_client)
+        category = Category.objects.get(slug='films')
+        genre = Genre.objects.get(slug='drama')
+        signals = []
+
+        def remember_transaction(sender, **kwargs):
+            signals.append(connection.in_atomic_block)
+
+        titles_bulk_created.connect(remember_transaction)
+        try:
+            before = get_generations([Title])
+            with transaction.atomic():
+                bulk_create_titles(
+                    [Title(name='Пачка', year=2000, category=category)],
+                    [[genre]]
+                )
+                # Читатель внутри окна до фиксации видит прежнее
+                # поколение, поэтому его ответ ляжет под старый ключ,
+                # который после фиксации уже не используется.
+                assert get_generations([Title]) == before, (
+                    'Проверьте, что поколение произведений не сдвигается '
+                    'до фиксации массовой вставки.'
+                )
+            assert signals == [False], (
+                'Проверьте, что titles_bulk_created отправляется после '
+                'фиксации транзакции.'
+            )
+            assert get_generations([Title]) != before
+            before = get_generations([Title])
+            with pytest.raises(RuntimeError):
+                with transaction.atomic():
+                    bulk_create_titles(
+                        [Title(name='Откат', year=2000, category=category)],
+                        [[genre]]
+                    )
+                    raise RuntimeError
+            assert signals == [False]
+            assert get_generations([Title]) == before
+        finally:
+            titles_bulk_created.disconnect(remember_transaction)
@@ -0,0 +1,56 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test22MultiGet:
+
+    TITLES_URL = '/api/v1/titles/'
+    USERS_URL = '/api/v1/users/'
+
+    def test_01_titles_by_ids(self, admin_client, client,
+                              django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        first, second = titles[0]['id'], titles[1]['id']
+        ids = f'{second},999999,{first},{second}'
+        with django_assert_num_queries(2):
+            response = client.get(self.TITLES_URL, {'ids': ids})
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}` с параметром '
+            '`ids` возвращает ответ со статусом 200.'
+        )
+        data = response.json()
+        assert [title['id'] for title in data] == [second, first], (
+            'Проверьте, что произведения отдаются в порядке `ids` без '
+            'повторов, а несуществующие id пропускаются.'
+        )
+        assert data[1]['genre'] and data[1]['category'], (
+            'Проверьте, что произведения в ответе содержат жанры '
+            'и категорию.'
+        )
+        response = client.get(self.TITLES_URL, {'ids': f'{first},abc'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что нечисловые `ids` приводят к ответу со '
+            'статусом 400.'
+        )
+        response = client.get(
+            self.TITLES_URL, {'ids': f'{first},{"9" * 25}'}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что слишком большие `ids` приводят к ответу со '
+            'статусом 400.'
+        )
+
+    def test_02_users_by_usernames(self, admin_client, admin, user,
+                                   moderator):
+        usernames = f'{user.username},nobody,{admin.username}'
+        response = admin_client.get(self.USERS_URL, {'usernames': usernames})
+        assert response.status_code == HTTPStatus.OK
+        assert [
+            item['username'] for item in response.json()
+        ] == [user.username, admin.username], (
+            'Проверьте, что пользователи отдаются в порядке `usernames`.'
+        )
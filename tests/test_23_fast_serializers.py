@@ -0,0 +1,65 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+
+from tests.utils import create_reviews
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23FastSerializers:
+
+    TITLES_URL = '/api/v1/titles/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+
+    def get_content(self, client, settings, url, params, fast):
+        settings.FAST_READ_SERIALIZERS = fast
+        cache.clear()
+        response = client.get(url, params)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{url}` возвращает ответ со '
+            'статусом 200.'
+        )
+        return response.content
+
+    def check_parity(self, client, settings, url, params=None):
+        assert self.get_content(
+            client, settings, url, params, fast=True
+        ) == self.get_content(client, settings, url, params, fast=False), (
+            f'Проверьте, что быстрый сериалайзер для `{url}` отдаёт '
+            'те же байты, что и обычный.'
+        )
+
+    def test_01_title_list_parity(self, admin_client, client, settings,
+                                  user, user_client, moderator,
+                                  moderator_client):
+        _, titles = create_reviews(
+            admin_client, {user: user_client, moderator: moderator_client}
+        )
+        admin_client.delete('/api/v1/categories/books/')
+        for params in (
+            None,
+            {'ordering': '-rating'},
+            {'pagination': 'cursor'},
+            {'genre': 'drama'},
+        ):
+            self.check_parity(client, settings, self.TITLES_URL, params)
+
+    def test_02_review_list_parity(self, admin_client, client, settings,
+                                   user, user_client, moderator,
+                                   moderator_client):
+        _, titles = create_reviews(
+            admin_client, {user: user_client, moderator: moderator_client}
+        )
+        self.check_parity(
+            client, settings,
+            self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        )
+
+    def test_03_fast_title_list_queries(self, admin_client, client, settings,
+                                        django_assert_num_queries):
+        create_reviews(admin_client, {})
+        settings.FAST_READ_SERIALIZERS = True
+        with django_assert_num_queries(3):
+            response = client.get(self.TITLES_URL)
+        assert len(response.json()['results']) == 2
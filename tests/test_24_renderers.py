@@ -0,0 +1,73 @@
+import json
+from http import HTTPStatus
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from api.v1.renderers import ORJSONRenderer
+from tests.utils import create_reviews, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test24Renderers:
+
+    TITLES_URL = '/api/v1/titles/'
+    GENRES_URL = '/api/v1/genres/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    MSGPACK = 'application/msgpack'
+
+    def check_json_parity(self, response):
+        assert response['Content-Type'] == 'application/json'
+        assert response.content == JSONRenderer().render(response.data), (
+            'Проверьте, что ORJSONRenderer отдаёт те же байты, '
+            'что и JSONRenderer.'
+        )
+
+    def test_01_orjson_parity(self, admin_client, client, user,
+                              user_client):
+        _, titles = create_reviews(admin_client, {user: user_client})
+        self.check_json_parity(client.get(self.TITLES_URL))
+        self.check_json_parity(client.get(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        ))
+        response = admin_client.post(self.GENRES_URL, data={})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        self.check_json_parity(response)
+        data = {'text': 'строка\u2028абзац\u2029конец'}
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_02_msgpack_negotiation(self, admin_client, client):
+        msgpack = pytest.importorskip('msgpack')
+        response = admin_client.post(
+            self.GENRES_URL,
+            data=msgpack.packb({'name': 'Триллер', 'slug': 'thriller'}),
+            content_type=self.MSGPACK
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что API принимает тело запроса в формате '
+            'MessagePack.'
+        )
+        response = client.get(self.GENRES_URL, HTTP_ACCEPT=self.MSGPACK)
+        assert response.status_code == HTTPStatus.OK
+        assert response['Content-Type'] == self.MSGPACK, (
+            'Проверьте, что при `Accept: application/msgpack` ответ '
+            'отдаётся в формате MessagePack.'
+        )
+        assert msgpack.unpackb(response.content, raw=False) == json.loads(
+            client.get(self.GENRES_URL).content
+        )
+
+    def test_03_vary_accept(self, admin_client, client):
+        create_titles(admin_client)
+        response = client.get(self.TITLES_URL, HTTP_ACCEPT='application/json')
+        vary = [value.strip() for value in response['Vary'].split(',')]
+        assert 'Accept' in vary, (
+            'Проверьте, что ответы с выбором формата по Accept содержат '
+            '`Vary: Accept`, иначе общие кеши перепутают форматы.'
+        )
+        response = client.get(
+            self.TITLES_URL, HTTP_ACCEPT='application/json',
+            HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert 'Accept' in response['Vary']
@@ -0,0 +1,94 @@
+import gzip
+from http import HTTPStatus
+
+import pytest
+
+from api import middleware
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test25Compression:
+
+    TITLES_URL = '/api/v1/titles/'
+    GENRES_URL = '/api/v1/genres/'
+
+    def create_many_titles(self, admin_client):
+        create_titles(admin_client)
+        for idx in range(3):
+            admin_client.post(self.TITLES_URL, data={
+                'name': f'Произведение {idx}',
+                'year': 2000 + idx,
+                'description': 'Длинное описание произведения. ' * 5,
+                'genre': ['horror', 'comedy'],
+                'category': 'films',
+            })
+
+    def test_01_gzip(self, admin_client, client, settings):
+        self.create_many_titles(admin_client)
+        plain = client.get(self.TITLES_URL)
+        assert 'Content-Encoding' not in plain, (
+            'Проверьте, что без `Accept-Encoding` ответ не сжимается.'
+        )
+        response = client.get(self.TITLES_URL, HTTP_ACCEPT_ENCODING='gzip')
+        assert response.status_code == HTTPStatus.OK
+        assert response['Content-Encoding'] == 'gzip', (
+            'Проверьте, что ответы API сжимаются gzip, если клиент '
+            'его принимает.'
+        )
+        assert 'Accept-Encoding' in response['Vary']
+        assert gzip.decompress(response.content) == plain.content
+        assert response['ETag'] != plain['ETag'], (
+            'Проверьте, что у сжатого и несжатого ответов разные ETag.'
+        )
+        settings.COMPRESSION_MIN_SIZE = len(plain.content) + 1
+        response = client.get(self.GENRES_URL, HTTP_ACCEPT_ENCODING='gzip')
+        assert 'Content-Encoding' not in response, (
+            'Проверьте, что короткие ответы не сжимаются.'
+        )
+
+    def test_02_precompressed_cache(self, admin_client, client, monkeypatch,
+                                    django_assert_num_queries):
+        self.create_many_titles(admin_client)
+        calls = []
+
+        def compress(content):
+            calls.append(content)
+            return gzip.compress(content, mtime=0)
+
+        monkeypatch.setitem(middleware.COMPRESSORS, 'gzip', compress)
+        first = client.get(self.TITLES_URL, HTTP_ACCEPT_ENCODING='gzip')
+        with django_assert_num_queries(0):
+            second = client.get(
+                self.TITLES_URL, HTTP_ACCEPT_ENCODING='gzip, br;q=0'
+            )
+        assert second['Content-Encoding'] == 'gzip'
+        assert second.content == first.content
+        assert second['ETag'] == first['ETag']
+        assert len(calls) == 1, (
+            'Проверьте, что ответ из кеша отдаётся уже сжатым, '
+            'без повторного сжатия.'
+        )
+        response = client.get(
+            self.TITLES_URL, HTTP_ACCEPT_ENCODING='gzip',
+            HTTP_IF_NONE_MATCH=first['ETag']
+        )
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_03_personal_pages_not_shared(self, admin_client, client,
+                                          admin):
+        self.create_many_titles(admin_client)
+        headers = {
+            'HTTP_ACCEPT': 'text/html',
+            'HTTP_ACCEPT_ENCODING': 'gzip',
+        }
+        first = admin_client.get(self.TITLES_URL, **headers)
+        assert first['Content-Encoding'] == 'gzip'
+        assert admin.username in gzip.decompress(first.content).decode()
+        second = client.get(self.TITLES_URL, **headers)
+        assert second.status_code == HTTPStatus.OK
+        page = gzip.decompress(second.content).decode()
+        assert admin.username not in page, (
+            'Проверьте, что сжатая страница Browsable API одного '
+            'пользователя не отдаётся из кеша другим клиентам.'
+        )
@@ -0,0 +1,59 @@
+import json
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_reviews
+
+
+@pytest.mark.django_db(transaction=True)
+class Test26TitleExport:
+
+    TITLES_URL = '/api/v1/titles/'
+    EXPORT_URL = '/api/v1/titles/export/'
+
+    def test_01_export(self, admin_client, user, user_client, settings,
+                       monkeypatch):
+        monkeypatch.setattr('api.v1.views.EXPORT_CHUNK_SIZE', 1)
+        create_reviews(admin_client, {user: user_client})
+        admin_client.post(self.TITLES_URL, data={
+            'name': 'Без жанра',
+            'year': 2001,
+            'genre': [],
+            'category': 'books',
+        })
+        response = admin_client.get(self.EXPORT_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос администратора к '
+            f'`{self.EXPORT_URL}` возвращает ответ со статусом 200.'
+        )
+        assert response.streaming, (
+            'Проверьте, что выгрузка каталога отдаётся потоком.'
+        )
+        assert response['Content-Type'] == 'application/x-ndjson'
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        exported = [json.loads(line) for line in lines]
+        assert [title['id'] for title in exported] == sorted(
+            title['id'] for title in exported
+        )
+        settings.FAST_READ_SERIALIZERS = False
+        expected = {
+            title['id']: title
+            for title in admin_client.get(self.TITLES_URL).json()['results']
+        }
+        assert len(exported) == len(expected) == 3, (
+            'Проверьте, что выгрузка содержит все произведения каталога.'
+        )
+        for title in exported:
+            assert title == expected[title['id']], (
+                'Проверьте, что строки выгрузки содержат произведения '
+                'в формате списка произведений.'
+            )
+
+    def test_02_export_admin_only(self, client, user_client):
+        assert client.get(self.EXPORT_URL).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        )
+        assert user_client.get(self.EXPORT_URL).status_code == (
+            HTTPStatus.FORBIDDEN
+        ), 'Проверьте, что выгрузка каталога доступна только администратору.'
@@ -0,0 +1,115 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+from reviews import recommendations
+from reviews.models import SimilarTitle
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test27SimilarTitles:
+
+    TITLES_URL = '/api/v1/titles/'
+    SIMILAR_URL_TEMPLATE = '/api/v1/titles/{title_id}/similar/'
+
+    def create_three_titles(self, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        response = admin_client.post(self.TITLES_URL, data={
+            'name': 'Чужой',
+            'year': 1979,
+            'genre': ['horror'],
+            'category': 'films',
+        })
+        return [title['id'] for title in titles] + [response.json()['id']]
+
+    def test_01_similar_endpoint(self, admin_client, client,
+                                 django_assert_num_queries):
+        first, second, third = self.create_three_titles(admin_client)
+        SimilarTitle.objects.bulk_create([
+            SimilarTitle(title_id=first, similar_id=third, score=0.5),
+            SimilarTitle(title_id=first, similar_id=second, score=0.9),
+            SimilarTitle(title_id=second, similar_id=first, score=0.9),
+        ])
+        url = self.SIMILAR_URL_TEMPLATE.format(title_id=first)
+        with django_assert_num_queries(2):
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{url}` возвращает ответ со '
+            'статусом 200.'
+        )
+        data = response.json()
+        assert [title['id'] for title in data] == [second, third], (
+            'Проверьте, что похожие произведения упорядочены по '
+            'убыванию сходства.'
+        )
+        assert data[0]['similarity'] == 0.9
+        assert data[0]['genre'] and data[0]['category']
+        response = client.get(self.SIMILAR_URL_TEMPLATE.format(
+            title_id=third
+        ))
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == []
+        response = client.get(self.SIMILAR_URL_TEMPLATE.format(
+            title_id=third + 100
+        ))
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        response = client.get(self.SIMILAR_URL_TEMPLATE.format(
+            title_id='abc'
+        ))
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что запрос похожих произведений с нечисловым '
+            'id возвращает ответ со статусом 404.'
+        )
+
+    def test_02_compute_similar_titles(self, admin_client, client,
+                                       user_client, moderator_client):
+        first, second, third = self.create_three_titles(admin_client)
+        scores = {
+            first: (10, 2, 6),
+            second: (9, 1, 6),
+            third: (1, 10, 5),
+        }
+        authors = (admin_client, user_client, moderator_client)
+        for title_id, title_scores in scores.items():
+            for author, score in zip(authors, title_scores):
+                create_single_review(author, title_id, 'Отзыв', score)
+        call_command('compute_similar_titles')
+        response = client.get(self.SIMILAR_URL_TEMPLATE.format(
+            title_id=first
+        ))
+        data = response.json()
+        assert [title['id'] for title in data] == [second], (
+            'Проверьте, что команда compute_similar_titles сохраняет '
+            'только положительно похожие произведения.'
+        )
+        assert 0 < data[0]['similarity'] <= 1
+        call_command('compute_similar_titles', block_size=1, top_k=5)
+        assert SimilarTitle.objects.filter(title_id=first).count() == 1, (
+            'Проверьте, что повторный расчёт заменяет прежние списки.'
+        )
+
+    def test_03_similar_titles_written_after_compute(self, admin_client,
+                                                     monkeypatch):
+        first, second, third = self.create_three_titles(admin_client)
+        transactions = []
+
+        def fake_similar_titles(top_k, block_size):
+            transactions.append(connection.in_atomic_block)
+            yield first, second, 0.9
+            yield first, third + 100, 0.8
+            yield second, first, 0.9
+
+        monkeypatch.setattr(
+            recommendations, 'iter_similar_titles', fake_similar_titles
+        )
+        assert recommendations.update_similar_titles(10, 10) == 2, (
+            'Проверьте, что пары с удалёнными произведениями не '
+            'сохраняются.'
+        )
+        assert transactions == [False], (
+            'Проверьте, что похожие произведения рассчитываются до начала '
+            'транзакции, а не под блокировкой записи.'
+        )
@@ -0,0 +1,113 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from reviews.models import Recommendation, Title
+from reviews.recommendations import FactorModel
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test28Recommendations:
+
+    TITLES_URL = '/api/v1/titles/'
+    RECOMMENDATIONS_URL = '/api/v1/users/me/recommendations/'
+
+    def create_four_titles(self, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        ids = [title['id'] for title in titles]
+        for name, year in (('Чужой', 1979), ('Хищник', 1987)):
+            response = admin_client.post(self.TITLES_URL, data={
+                'name': name,
+                'year': year,
+                'genre': ['horror'],
+                'category': 'films',
+            })
+            ids.append(response.json()['id'])
+        return ids
+
+    def get_recommended(self, client):
+        response = client.get(self.RECOMMENDATIONS_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.RECOMMENDATIONS_URL}` '
+            'возвращает ответ со статусом 200.'
+        )
+        return [title['id'] for title in response.json()]
+
+    def test_01_recommendations_endpoint(self, admin_client, client, user,
+                                         user_client):
+        first, second, third, _ = self.create_four_titles(admin_client)
+        Recommendation.objects.bulk_create([
+            Recommendation(user=user, title_id=first, score=6.5),
+            Recommendation(user=user, title_id=third, score=8.0),
+        ])
+        assert self.get_recommended(user_client) == [third, first], (
+            'Проверьте, что рекомендации упорядочены по убыванию '
+            'ожидаемой оценки.'
+        )
+        assert self.get_recommended(admin_client) == []
+        assert client.get(self.RECOMMENDATIONS_URL).status_code == (
+            HTTPStatus.UNAUTHORIZED
+        )
+
+    def test_02_compute_recommendations(self, admin_client, user_client,
+                                        moderator_client,
+                                        user_superuser_client, settings,
+                                        tmp_path):
+        settings.RECOMMENDATIONS_DIR = tmp_path
+        liked, second, disliked, fourth = self.create_four_titles(
+            admin_client
+        )
+        scores = {
+            admin_client: (10, 9, 2, 8),
+            moderator_client: (9, 10, 1, 9),
+        }
+        for client, title_scores in scores.items():
+            for title_id, score in zip(
+                (liked, second, disliked, fourth), title_scores
+            ):
+                create_single_review(client, title_id, 'Отзыв', score)
+        create_single_review(user_client, liked, 'Отзыв', 10)
+        call_command('compute_recommendations', factors=4)
+        assert (tmp_path / 'user_factors.npy').exists(), (
+            'Проверьте, что факторы сохраняются в файлы .npy.'
+        )
+        recommended = self.get_recommended(user_client)
+        assert sorted(recommended) == sorted((second, disliked, fourth)), (
+            'Проверьте, что пользователю рекомендуются только '
+            'произведения, которые он ещё не оценил.'
+        )
+        assert recommended[-1] == disliked, (
+            'Проверьте, что произведения, которые не нравятся похожим '
+            'пользователям, оказываются в конце рекомендаций.'
+        )
+        create_single_review(user_client, second, 'Отзыв', 9)
+        create_single_review(user_superuser_client, liked, 'Отзыв', 9)
+        call_command('compute_recommendations')
+        assert sorted(self.get_recommended(user_client)) == sorted(
+            (disliked, fourth)
+        ), 'Проверьте, что дообучение учитывает новые отзывы.'
+        assert liked not in self.get_recommended(user_superuser_client), (
+            'Проверьте, что дообучение добавляет новых пользователей.'
+        )
+        assert len(self.get_recommended(user_superuser_client)) == 3
+
+    def test_03_deleted_titles_not_recommended(self, admin_client, user,
+                                               user_client, moderator_client,
+                                               tmp_path):
+        titles = self.create_four_titles(admin_client)
+        for client in (admin_client, moderator_client):
+            for title_id in titles:
+                create_single_review(client, title_id, 'Отзыв', 8)
+        create_single_review(user_client, titles[0], 'Отзыв', 8)
+        model = FactorModel(tmp_path)
+        users = model.train(factors=2, iterations=2, regularization=0.1)
+        Title.objects.filter(pk=titles[1]).delete()
+        model.save().recommend(users, 10)
+        assert sorted(self.get_recommended(user_client)) == sorted(
+            titles[2:]
+        ), (
+            'Проверьте, что произведения, удалённые после расчёта '
+            'факторов, не попадают в рекомендации.'
+        )
@@ -0,0 +1,91 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from api_yamdb.constants import TRENDING_HALF_LIFE
+from reviews.models import TitleActivity
+from reviews.utils import record_title_activity
+from tests.utils import (create_single_comment, create_single_review,
+                         create_titles)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test29Trending:
+
+    TRENDING_URL = '/api/v1/titles/trending/'
+
+    def create_activity(self, admin_client, user_client, moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        first, second = (title['id'] for title in titles)
+        review = create_single_review(user_client, second, 'Отзыв', 5).json()
+        create_single_review(moderator_client, second, 'Отзыв', 7)
+        create_single_comment(user_client, second, review['id'], 'Да')
+        create_single_review(user_client, first, 'Отзыв', 9)
+        return first, second
+
+    def test_01_trending_endpoint(self, admin_client, user_client,
+                                  moderator_client, client,
+                                  django_assert_num_queries):
+        first, second = self.create_activity(
+            admin_client, user_client, moderator_client
+        )
+        with django_assert_num_queries(2):
+            response = client.get(self.TRENDING_URL)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.TRENDING_URL}` '
+            'возвращает ответ со статусом 200.'
+        )
+        data = response.json()
+        assert [title['id'] for title in data] == [second, first], (
+            'Проверьте, что произведения упорядочены по убыванию '
+            'активности: отзывы и комментарии считаются вместе.'
+        )
+        assert data[0]['activity'] == pytest.approx(3, rel=1e-3)
+        assert data[1]['activity'] == pytest.approx(1, rel=1e-3)
+        assert data[0]['genre'] and data[0]['category']
+        response = client.get(self.TRENDING_URL, {'limit': 1})
+        assert [title['id'] for title in response.json()] == [second]
+
+    def test_02_activity_decays(self, admin_client, client):
+        titles, _, _ = create_titles(admin_client)
+        first, second = (title['id'] for title in titles)
+        now = timezone.now()
+        half_life = timedelta(seconds=TRENDING_HALF_LIFE)
+        for _ in range(3):
+            record_title_activity(first, now - 2 * half_life)
+        record_title_activity(second, now - half_life)
+        record_title_activity(second, now - 30 * half_life)
+        data = client.get(self.TRENDING_URL).json()
+        assert [title['id'] for title in data] == [first, second], (
+            'Проверьте, что вес события вдвое уменьшается за каждый '
+            'период полураспада.'
+        )
+        assert data[0]['activity'] == pytest.approx(0.75, rel=1e-3)
+        assert data[1]['activity'] == pytest.approx(0.5, rel=1e-3)
+        TitleActivity.objects.filter(title_id=first).update(
+            score=TitleActivity.objects.get(title_id=first).score - 20
+        )
+        data = client.get(self.TRENDING_URL).json()
+        assert [title['id'] for title in data] == [second], (
+            'Проверьте, что произведения с почти угасшей активностью '
+            'не попадают в список.'
+        )
+
+    def test_03_rebuild_title_activity(self, admin_client, user_client,
+                                       moderator_client, client):
+        first, second = self.create_activity(
+            admin_client, user_client, moderator_client
+        )
+        expected = client.get(self.TRENDING_URL).json()
+        TitleActivity.objects.all().delete()
+        assert client.get(self.TRENDING_URL).json() == []
+        call_command('rebuild_title_activity')
+        data = client.get(self.TRENDING_URL).json()
+        assert [title['id'] for title in data] == [second, first]
+        for title, expected_title in zip(data, expected):
+            assert title['activity'] == pytest.approx(
+                expected_title['activity'], rel=1e-3
+            )
@@ -0,0 +1,57 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test30TitleLookup:
+
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+
+    @staticmethod
+    def title_loads(queries):
+        """Запросы, загружающие произведение целиком."""
+        return [
+            query['sql'] for query in queries
+            if query['sql'].startswith('SELECT')
+            and '"reviews_title"."description"' in query['sql']
+        ]
+
+    def test_01_review_create_loads_title_once(self, admin_client,
+                                               user_client):
+        titles, _, _ = create_titles(admin_client)
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        with CaptureQueriesContext(connection) as context:
+            response = user_client.post(
+                url, data={'text': 'Отзыв', 'score': 5}
+            )
+        assert response.status_code == HTTPStatus.CREATED
+        assert len(self.title_loads(context.captured_queries)) == 1, (
+            'Проверьте, что при создании отзыва произведение загружается '
+            'из базы данных один раз за запрос.'
+        )
+
+    def test_02_review_list_checks_title_exists(self, admin_client,
+                                                user_client, client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(user_client, title_id, 'Отзыв', 5)
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=title_id)
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['count'] == 1
+        assert not self.title_loads(context.captured_queries), (
+            'Проверьте, что для списка отзывов произведение не '
+            'загружается целиком: достаточно проверить его существование.'
+        )
+
+    def test_03_missing_title(self, user_client, client):
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=100)
+        assert client.get(url).status_code == HTTPStatus.NOT_FOUND
+        response = user_client.post(url, data={'text': 'Отзыв', 'score': 5})
+        assert response.status_code == HTTPStatus.NOT_FOUND